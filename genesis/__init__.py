@@ -41,7 +41,7 @@ if _IS_OLD_TORCH:
 
 # Global state
 _initialized: bool = False
-_scene_registry: list[weakref.ReferenceType["Scene"]] = []
+_scene_registry: "weakref.WeakSet[Scene]" = weakref.WeakSet()
 _module_registry: set[tuple[Callable[[], None], Callable[[], None]]] = set()
 _theme: str | None = None
 logger: Logger | None = None
@@ -375,13 +375,11 @@ def destroy():
     if logger:
         logger.info("💤 Exiting Genesis and caching compiled kernels...")
 
-    # Destroy all scenes. A weakref that no longer resolves means the scene was already garbage-collected (and its
-    # resources released), so there is nothing left to destroy - skip it rather than asserting.
+    # Destroy all scenes. Garbage-collected scenes have already released their resources and dropped out of the
+    # registry on their own.
     global _scene_registry
-    for scene_ref in _scene_registry.copy():
-        scene = scene_ref()
-        if scene is not None:
-            scene.destroy()
+    for scene in tuple(_scene_registry):
+        scene.destroy()
 
     # Release every module-level asset cache (parsed meshes, baked RGBA textures, ...) so the large arrays they hold
     # for destroyed scenes are not retained globally.
@@ -141,10 +141,6 @@ class FEMEntity(Entity):
             # For cloth, elements are already surface triangles
             self._surface_tri_np = self.elems
             self._n_surfaces = len(self._surface_tri_np)
-            if self._n_surfaces > 0:
-                self._n_surface_vertices = len(np.unique(self._surface_tri_np))
-            else:
-                self._n_surface_vertices = 0
             # For cloth, each triangle is its own "element"
             self._surface_el_np = np.arange(self.elems.shape[0], dtype=gs.np_int)
         else:
@@ -164,15 +160,15 @@ class FEMEntity(Entity):
             self._surface_tri_np = surface_tri
             self._n_surfaces = len(self._surface_tri_np)
 
-            if self._n_surfaces > 0:
-                self._n_surface_vertices = len(np.unique(self._surface_tri_np))
-            else:
-                self._n_surface_vertices = 0
-
             tri2el = np.repeat(np.arange(self.elems.shape[0], dtype=gs.np_int)[:, np.newaxis], 4, axis=1)
             unique_el = tri2el.flat[unique_idcs]
             self._surface_el_np = unique_el[cnt == 1]
 
+        # Vertex indices are dense in [0, n_vertices), so a boolean mask counts them in linear time without sorting
+        is_surface_vertex = np.zeros(self.n_vertices, dtype=np.bool_)
+        is_surface_vertex[self._surface_tri_np] = True
+        self._n_surface_vertices = int(np.count_nonzero(is_surface_vertex))
+
         if isinstance(self.sim.coupler, SAPCoupler):
             self.compute_pressure_field()
 
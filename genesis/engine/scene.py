@@ -1,15 +1,14 @@
 import collections.abc
+import contextlib
+import math
 import os
-import pickle
 import sys
 import time
 import trimesh
-import weakref
 from typing import TYPE_CHECKING, Callable, Iterable, Literal, overload
 
 import numpy as np
 import torch
-import quadrants as qd
 from quadrants.lang import impl
 
 import genesis as gs
@@ -47,12 +46,64 @@ from genesis.utils.warnings import warn_once
 
 if TYPE_CHECKING:
     from genesis.engine.entities.base_entity import Entity
+    from genesis.engine.entities import Emitter
     from genesis.engine.entities.rigid_entity import RigidEntity
     from genesis.engine.sensors.base_sensor import Sensor
     from genesis.recorders import Recorder
     from genesis.options.sensors.options import SensorOptions, SensorT
 
 
+# Supported `surface.vis_mode` per material type, the first one being the default. Material types are resolved by walking
+# the MRO of the material class, so more specific types take precedence over their base class.
+_MATERIAL_VIS_MODES: dict[type[Material], tuple[str, ...]] = {
+    gs.materials.Kinematic: ("visual", "collision", "sdf"),
+    gs.materials.Tool: ("visual", "collision", "sdf"),
+    gs.materials.PBD.Liquid: ("particle", "recon"),
+    gs.materials.PBD.Particle: ("particle", "recon"),
+    gs.materials.MPM.Liquid: ("particle", "recon"),
+    gs.materials.MPM.Sand: ("particle", "recon"),
+    gs.materials.MPM.Snow: ("particle", "recon"),
+    gs.materials.SPH.Liquid: ("particle", "recon"),
+    gs.materials.SF.Smoke: ("particle",),
+    gs.materials.PBD.Base: ("visual", "particle", "recon"),
+    gs.materials.MPM.Base: ("visual", "particle", "recon"),
+    gs.materials.SPH.Base: ("visual", "particle", "recon"),
+    gs.materials.FEM.Base: ("visual",),
+    gs.materials.Hybrid: ("particle", "visual"),
+}
+
+
+def _set_surface_defaults(morph: Morph, material: Material, surface: Surface, vis_mode: str | None) -> None:
+    if isinstance(material, gs.materials.Rigid):
+        # small sdf res is sufficient for primitives regardless of size
+        if isinstance(morph, gs.morphs.Primitive):
+            material.sdf_max_res = 32
+
+    # some morph should not smooth surface normal
+    if isinstance(morph, (gs.morphs.Box, gs.morphs.Cylinder, gs.morphs.Terrain)):
+        surface.smooth = False
+
+    if surface.double_sided is None:
+        surface.double_sided = isinstance(material, (gs.materials.PBD.Cloth, gs.materials.FEM.Cloth))
+
+    if vis_mode is not None:
+        surface.vis_mode = vis_mode
+    # validate and populate default surface.vis_mode considering morph type
+    for material_cls in type(material).__mro__:
+        vis_modes = _MATERIAL_VIS_MODES.get(material_cls)
+        if vis_modes is not None:
+            break
+    else:
+        gs.raise_exception(f"Unsupported material: {material}.")
+    if surface.vis_mode is None:
+        surface.vis_mode = vis_modes[0]
+    if surface.vis_mode not in vis_modes:
+        gs.raise_exception(
+            f"Unsupported `surface.vis_mode` for material {material}: '{surface.vis_mode}'. Expected one of: "
+            f"{list(vis_modes)}."
+        )
+
+
 @gs.assert_initialized
 class Scene(RBC):
     """
@@ -91,6 +142,45 @@ class Scene(RBC):
         Whether to show the FPS in the terminal.
     """
 
+    # Scenes are accessed at every step, so attributes are stored in slots for faster lookup and smaller footprint
+    __slots__ = (
+        "__weakref__",
+        "sim_options",
+        "coupler_options",
+        "tool_options",
+        "rigid_options",
+        "kinematic_options",
+        "mpm_options",
+        "sph_options",
+        "fem_options",
+        "sf_options",
+        "pbd_options",
+        "profiling_options",
+        "vis_options",
+        "viewer_options",
+        "renderer_options",
+        "_sim",
+        "_visualizer",
+        "_recorder_manager",
+        "_emitters",
+        "FPS_tracker",
+        "_backward_ready",
+        "_forward_ready",
+        "_uid",
+        "_t",
+        "_is_built",
+        "_pre_step_callbacks",
+        "n_envs",
+        "env_spacing",
+        "n_envs_per_row",
+        "_B",
+        "_envs_idx",
+        "_single_env_views",
+        "envs_offset",
+        "_para_level",
+        "_init_state",
+    )
+
     def __init__(
         self,
         sim_options: SimOptions | None = None,
@@ -182,20 +272,26 @@ class Scene(RBC):
             pbd_options=self.pbd_options,
         )
 
-        # visualizer
-        self._visualizer = Visualizer(
-            scene=self,
-            show_viewer=show_viewer,
-            vis_options=vis_options,
-            viewer_options=viewer_options,
-            renderer_options=renderer,
-        )
+        # visualizer, whose construction is deferred to first use in headless mode, so that scenes that are never
+        # rendered do not pay for setting up the rendering pipeline
+        self._visualizer = None
+        if show_viewer:
+            self._visualizer = Visualizer(
+                scene=self,
+                show_viewer=show_viewer,
+                vis_options=vis_options,
+                viewer_options=viewer_options,
+                renderer_options=renderer,
+            )
 
         # recorders
         self._recorder_manager = RecorderManager(self._sim.dt)
 
         # emitters
-        self._emitters = gs.List()
+        self._emitters: list["Emitter"] = []
+
+        if self.profiling_options.show_FPS:
+            self.FPS_tracker = FPSTracker(0, alpha=self.profiling_options.FPS_tracker_alpha)
 
         self._backward_ready = False
         self._forward_ready = False
@@ -227,47 +323,24 @@ class Scene(RBC):
         profiling_options: ProfilingOptions,
         renderer_options: RendererOptions,
     ):
-        if not isinstance(sim_options, SimOptions):
-            gs.raise_exception("`sim_options` should be an instance of `SimOptions`.")
-
-        if not isinstance(coupler_options, BaseCouplerOptions):
-            gs.raise_exception("`coupler_options` should be an instance of `BaseCouplerOptions`.")
-
-        if not isinstance(tool_options, ToolOptions):
-            gs.raise_exception("`tool_options` should be an instance of `ToolOptions`.")
-
-        if not isinstance(rigid_options, RigidOptions):
-            gs.raise_exception("`rigid_options` should be an instance of `RigidOptions`.")
-
-        if not isinstance(kinematic_options, KinematicOptions):
-            gs.raise_exception("`kinematic_options` should be an instance of `KinematicOptions`.")
-
-        if not isinstance(mpm_options, MPMOptions):
-            gs.raise_exception("`mpm_options` should be an instance of `MPMOptions`.")
-
-        if not isinstance(sph_options, SPHOptions):
-            gs.raise_exception("`sph_options` should be an instance of `SPHOptions`.")
-
-        if not isinstance(fem_options, FEMOptions):
-            gs.raise_exception("`fem_options` should be an instance of `FEMOptions`.")
-
-        if not isinstance(sf_options, SFOptions):
-            gs.raise_exception("`sf_options` should be an instance of `SFOptions`.")
-
-        if not isinstance(pbd_options, PBDOptions):
-            gs.raise_exception("`pbd_options` should be an instance of `PBDOptions`.")
-
-        if not isinstance(vis_options, VisOptions):
-            gs.raise_exception("`vis_options` should be an instance of `VisOptions`.")
-
-        if not isinstance(viewer_options, ViewerOptions):
-            gs.raise_exception("`viewer_options` should be an instance of `ViewerOptions`.")
-
-        if not isinstance(profiling_options, ProfilingOptions):
-            gs.raise_exception("`profiling_options` should be an instance of `ProfilingOptions`.")
-
-        if not isinstance(renderer_options, RendererOptions):
-            gs.raise_exception("`renderer` should be an instance of `gs.renderers.Renderer`.")
+        for options, options_cls, options_name in (
+            (sim_options, SimOptions, "sim_options"),
+            (coupler_options, BaseCouplerOptions, "coupler_options"),
+            (tool_options, ToolOptions, "tool_options"),
+            (rigid_options, RigidOptions, "rigid_options"),
+            (kinematic_options, KinematicOptions, "kinematic_options"),
+            (mpm_options, MPMOptions, "mpm_options"),
+            (sph_options, SPHOptions, "sph_options"),
+            (fem_options, FEMOptions, "fem_options"),
+            (sf_options, SFOptions, "sf_options"),
+            (pbd_options, PBDOptions, "pbd_options"),
+            (vis_options, VisOptions, "vis_options"),
+            (viewer_options, ViewerOptions, "viewer_options"),
+            (profiling_options, ProfilingOptions, "profiling_options"),
+            (renderer_options, RendererOptions, "renderer"),
+        ):
+            if not isinstance(options, options_cls):
+                gs.raise_exception(f"`{options_name}` should be an instance of `{options_cls.__name__}`.")
 
         # Validate rigid_options against sim_options
         if rigid_options.box_box_detection is None:
@@ -289,11 +362,7 @@ class Scene(RBC):
 
     def destroy(self):
         # Stop tracking this scene right away
-        try:
-            gs._scene_registry.remove(weakref.ref(self))
-        except ValueError:
-            # This scene may have been destroyed previously
-            pass
+        gs._scene_registry.discard(self)
 
         if getattr(self, "_recorder_manager", None) is not None:
             if self._recorder_manager.is_recording:
@@ -375,6 +444,11 @@ class Scene(RBC):
             # assign a local surface, otherwise modification will apply on global default surface
             surface = gs.surfaces.Default()
 
+        # Fast path for rigid primitives, by far the most common entities, for which the morph checks are moot
+        if isinstance(material, gs.materials.Rigid) and isinstance(morph, gs.morphs.Primitive):
+            _set_surface_defaults(morph, material, surface, vis_mode)
+            return self._sim._add_entity(morph, material, surface, visualize_contact, name)
+
         # Handle heterogeneous morphs (any iterable of morphs, excluding Morph objects)
         is_heterogeneous = isinstance(morph, collections.abc.Iterable) and not isinstance(morph, Morph)
         if is_heterogeneous:
@@ -396,92 +470,11 @@ class Scene(RBC):
         else:
             morph_for_checks = morph
 
-        if isinstance(material, gs.materials.Rigid):
-            # small sdf res is sufficient for primitives regardless of size
-            if isinstance(morph_for_checks, gs.morphs.Primitive):
-                material.sdf_max_res = 32
-
-        # some morph should not smooth surface normal
-        if isinstance(morph_for_checks, (gs.morphs.Box, gs.morphs.Cylinder, gs.morphs.Terrain)):
-            surface.smooth = False
-
         if isinstance(morph_for_checks, (gs.morphs.URDF, gs.morphs.MJCF, gs.morphs.USD, gs.morphs.Terrain)):
             if not isinstance(material, (gs.materials.Kinematic, gs.materials.Hybrid)):
                 gs.raise_exception(f"Unsupported material for morph: {material} and {morph_for_checks}.")
 
-        if surface.double_sided is None:
-            surface.double_sided = isinstance(material, (gs.materials.PBD.Cloth, gs.materials.FEM.Cloth))
-
-        if vis_mode is not None:
-            surface.vis_mode = vis_mode
-        # validate and populate default surface.vis_mode considering morph type
-        if isinstance(material, (gs.materials.Kinematic, gs.materials.Tool)):
-            if surface.vis_mode is None:
-                surface.vis_mode = "visual"
-
-            if surface.vis_mode not in ("visual", "collision", "sdf"):
-                gs.raise_exception(
-                    f"Unsupported `surface.vis_mode` for material {material}: '{surface.vis_mode}'. Expected one of: "
-                    "['visual', 'collision', 'sdf']."
-                )
-
-        elif isinstance(
-            material,
-            (
-                gs.materials.PBD.Liquid,
-                gs.materials.PBD.Particle,
-                gs.materials.MPM.Liquid,
-                gs.materials.MPM.Sand,
-                gs.materials.MPM.Snow,
-                gs.materials.SPH.Liquid,
-            ),
-        ):
-            if surface.vis_mode is None:
-                surface.vis_mode = "particle"
-
-            if surface.vis_mode not in ("particle", "recon"):
-                gs.raise_exception(
-                    f"Unsupported `surface.vis_mode` for material {material}: '{surface.vis_mode}'. Expected one of: ['particle', 'recon']."
-                )
-
-        elif isinstance(material, gs.materials.SF.Smoke):
-            if surface.vis_mode is None:
-                surface.vis_mode = "particle"
-
-            if surface.vis_mode not in ("particle",):
-                gs.raise_exception(
-                    f"Unsupported `surface.vis_mode` for material {material}: '{surface.vis_mode}'. Expected one of: ['particle', 'recon']."
-                )
-
-        elif isinstance(material, (gs.materials.PBD.Base, gs.materials.MPM.Base, gs.materials.SPH.Base)):
-            if surface.vis_mode is None:
-                surface.vis_mode = "visual"
-
-            if surface.vis_mode not in ("visual", "particle", "recon"):
-                gs.raise_exception(
-                    f"Unsupported `surface.vis_mode` for material {material}: '{surface.vis_mode}'. Expected one of: ['visual', 'particle', 'recon']."
-                )
-
-        elif isinstance(material, gs.materials.FEM.Base):
-            if surface.vis_mode is None:
-                surface.vis_mode = "visual"
-
-            if surface.vis_mode not in ("visual",):
-                gs.raise_exception(
-                    f"Unsupported `surface.vis_mode` for material {material}: '{surface.vis_mode}'. Expected one of: ['visual']."
-                )
-
-        elif isinstance(material, gs.materials.Hybrid):  # determine the visual of the outer soft part
-            if surface.vis_mode is None:
-                surface.vis_mode = "particle"
-
-            if surface.vis_mode not in ("particle", "visual"):
-                gs.raise_exception(
-                    f"Unsupported `surface.vis_mode` for material {material}: '{surface.vis_mode}'. Expected one of: ['particle', 'visual']."
-                )
-
-        else:
-            gs.raise_exception()
+        _set_surface_defaults(morph_for_checks, material, surface, vis_mode)
 
         # Set material-dependent default options
         morphs_to_configure = morph if is_heterogeneous else (morph,)
@@ -594,7 +587,7 @@ class Scene(RBC):
             gs.raise_exception("Light morph only supports `gs.morphs.Primitive` or `gs.morphs.Mesh`.")
         meshes = gs.Mesh.from_morph_surface(morph, gs.surfaces.Plastic(smooth=False))
         for mesh in meshes:
-            self._visualizer.add_mesh_light(
+            self.visualizer.add_mesh_light(
                 mesh, color, intensity, morph.pos, morph.quat, revert_dir, double_sided, cutoff
             )
 
@@ -781,7 +774,7 @@ class Scene(RBC):
         """
         if denoise is None:
             denoise = sys.platform != "darwin"
-        return self._visualizer.add_camera(
+        return self.visualizer.add_camera(
             res, pos, lookat, up, model, fov, aperture, focus_dist, GUI, spp, denoise, near, far, env_idx, debug
         )
 
@@ -894,14 +887,7 @@ class Scene(RBC):
             compile_kernels = True
 
         # Start tracking the scene right away, so that destroy is called even if some error fires during build
-        def _destroy_callback(scene_ref: weakref.ReferenceType["Scene"]):
-            scene = scene_ref()
-            for i, scene_ref_i in enumerate(gs._scene_registry):
-                if scene is scene_ref_i():
-                    del gs._scene_registry[i]
-                    break
-
-        gs._scene_registry.append(weakref.ref(self, _destroy_callback))
+        gs._scene_registry.add(self)
 
         with gs.logger.timer(f"Building scene ~~~<{self._uid}>~~~..."):
             self._parallelize(n_envs, env_spacing, n_envs_per_row, center_envs_at_origin)
@@ -914,16 +900,21 @@ class Scene(RBC):
 
             self._is_built = True
 
-        with gs.logger.timer("Compiling simulation kernels..."):
-            self._sim.step()
-            self._reset()
+        # Kernels are compiled on first call, and only solvers that are active get stepped, so the warm-up step merely
+        # moves the compilation of the kernels involved in stepping from the first user step to build time. The
+        # warm-up step bypasses the scene, so restoring the initial state captured above is all it takes to undo it.
+        if self.profiling_options.eager_compile:
+            with gs.logger.timer("Compiling simulation kernels..."):
+                self._sim.step()
+                self._sim.reset(self._init_state)
 
         # visualizer
-        with gs.logger.timer("Building visualizer..."):
-            self._visualizer.build()
+        if self._visualizer is not None:
+            with gs.logger.timer("Building visualizer..."):
+                self._visualizer.build()
 
         if self.profiling_options.show_FPS:
-            self.FPS_tracker = FPSTracker(self.n_envs, alpha=self.profiling_options.FPS_tracker_alpha)
+            self.FPS_tracker.reset(self.n_envs)
 
         # recorders
         self._recorder_manager.build()
@@ -942,22 +933,27 @@ class Scene(RBC):
         # true batch size
         self._B = max(1, self.n_envs)
         self._envs_idx = torch.arange(self._B, dtype=gs.tc_int, device=gs.device)
+        # Integer `envs_idx` is the most common case in per-env control loops, so views are created once here
+        self._single_env_views = tuple(self._envs_idx[i : i + 1] for i in range(self._B))
 
         if self.n_envs_per_row is None:
-            self.n_envs_per_row = np.ceil(np.sqrt(self._B)).astype(int)
+            self.n_envs_per_row = math.isqrt(self._B - 1) + 1
 
         # compute offset values for visualizing each env
         if not isinstance(env_spacing, (list, tuple)) or len(env_spacing) != 2:
             gs.raise_exception("`env_spacing` should be a tuple of length 2.")
-        offset_x = (np.arange(self._B) // self.n_envs_per_row) * self.env_spacing[0]
-        offset_y = (np.arange(self._B) % self.n_envs_per_row) * self.env_spacing[1]
-        offset_z = np.zeros((self._B,))
-        self.envs_offset = np.stack((offset_x, offset_y, offset_z), axis=-1, dtype=gs.np_float)
+        self.envs_offset = np.zeros((self._B, 3), dtype=gs.np_float)
+        if self.n_envs > 0:
+            envs_row, envs_col = np.divmod(np.arange(self._B), self.n_envs_per_row)
+            np.multiply(envs_row, self.env_spacing[0], out=self.envs_offset[:, 0])
+            np.multiply(envs_col, self.env_spacing[1], out=self.envs_offset[:, 1])
 
-        # move to center
-        if center_envs_at_origin:
-            center = (np.max(self.envs_offset, axis=0) + np.min(self.envs_offset, axis=0)) / 2.0
-            self.envs_offset -= center
+            # move to center, the extent of the grid being known in advance
+            if center_envs_at_origin:
+                envs_row_max = (self._B - 1) // self.n_envs_per_row
+                envs_col_max = min(self._B, self.n_envs_per_row) - 1
+                self.envs_offset[:, 0] -= 0.5 * envs_row_max * self.env_spacing[0]
+                self.envs_offset[:, 1] -= 0.5 * envs_col_max * self.env_spacing[1]
 
         """
         Notes:
@@ -1015,7 +1011,7 @@ class Scene(RBC):
 
         # Clear the entire cache of the visualizer.
         # TODO: Could be optimized to only clear cache associated the the environments being reset.
-        if self._visualizer.is_built:
+        if self._visualizer is not None and self._visualizer.is_built:
             self._visualizer.reset()
 
         # TODO: sets _next_particle = 0; not sure this is env isolation safe
@@ -1060,20 +1056,27 @@ class Scene(RBC):
         self._reset(snapshot, keep_init=True)
         return snapshot
 
-    def _get_state(self):
-        return self._sim.get_state()
+    def _get_state(self, out: SimState | None = None):
+        return self._sim.get_state(out=out)
 
     @gs.assert_built
-    def get_state(self):
+    def get_state(self, *, out: SimState | None = None):
         """
         Returns the current state of the scene.
 
+        Parameters
+        ----------
+        out : genesis.SimState, optional
+            A state previously returned by this scene, filled in place instead of allocating a new one. This avoids
+            per-call allocations when polling the state every step, at the cost of overwriting the content of `out`.
+            Not supported when `requires_grad=True`.
+
         Returns
         -------
         state : genesis.SimState
             The state of the scene at the current time step.
         """
-        return self._get_state()
+        return self._get_state(out)
 
     def register_pre_step_callback(self, callback):
         """Register a callback invoked at the start of each ``step()``, on the stepping thread. A callback
@@ -1098,7 +1101,7 @@ class Scene(RBC):
             self._sim.step()
             self._t += 1
 
-        if update_visualizer:
+        if update_visualizer and self._visualizer is not None:
             # Force the refresh when the sim did not advance (e.g. paused) so edits made off the step loop -
             # like a GUI joint slider calling set_qpos - are still drawn and the viewer does not appear frozen.
             self._visualizer.update(force=not advance, auto=refresh_visualizer)
@@ -1137,8 +1140,8 @@ class Scene(RBC):
         node : genesis.ext.pyrender.mesh.Mesh
             The created debug object.
         """
-        with self._visualizer.viewer_lock:
-            return self._visualizer.context.draw_debug_line(start, end, radius, color)
+        with self.visualizer.viewer_lock:
+            return self.visualizer.context.draw_debug_line(start, end, radius, color)
 
     @gs.assert_built
     def draw_debug_arrow(self, pos, vec=(0, 0, 1), radius=0.01, color=(1.0, 0.0, 0.0, 0.5)):
@@ -1161,8 +1164,8 @@ class Scene(RBC):
         node : genesis.ext.pyrender.mesh.Mesh
             The created debug object.
         """
-        with self._visualizer.viewer_lock:
-            return self._visualizer.context.draw_debug_arrow(pos, vec, radius, color)
+        with self.visualizer.viewer_lock:
+            return self.visualizer.context.draw_debug_arrow(pos, vec, radius, color)
 
     @gs.assert_built
     def draw_debug_frame(self, T, axis_length=1.0, origin_size=0.015, axis_radius=0.01, color=None):
@@ -1187,8 +1190,8 @@ class Scene(RBC):
         node : genesis.ext.pyrender.mesh.Mesh
             The created debug object.
         """
-        with self._visualizer.viewer_lock:
-            return self._visualizer.context.draw_debug_frame(T, axis_length, origin_size, axis_radius, color)
+        with self.visualizer.viewer_lock:
+            return self.visualizer.context.draw_debug_frame(T, axis_length, origin_size, axis_radius, color)
 
     @gs.assert_built
     def draw_debug_frames(self, Ts, axis_length=1.0, origin_size=0.015, axis_radius=0.01, color=None):
@@ -1197,7 +1200,7 @@ class Scene(RBC):
 
         Parameters
         ----------
-        Ts : array_like, shape (n, 4, 4)
+        Ts : array_like | torch.Tensor, shape (n, 4, 4)
             The transformation matrices of frames.
         axis_length : float, optional
             The length of the axes.
@@ -1213,8 +1216,8 @@ class Scene(RBC):
         node : genesis.ext.pyrender.mesh.Mesh
             The created debug object.
         """
-        with self._visualizer.viewer_lock:
-            return self._visualizer.context.draw_debug_frames(Ts, axis_length, origin_size, axis_radius, color)
+        with self.visualizer.viewer_lock:
+            return self.visualizer.context.draw_debug_frames(Ts, axis_length, origin_size, axis_radius, color)
 
     @gs.assert_built
     def draw_debug_mesh(self, mesh, pos=np.zeros(3), T=None):
@@ -1235,8 +1238,8 @@ class Scene(RBC):
         node : genesis.ext.pyrender.mesh.Mesh
             The created debug object.
         """
-        with self._visualizer.viewer_lock:
-            return self._visualizer.context.draw_debug_mesh(mesh, pos, T)
+        with self.visualizer.viewer_lock:
+            return self.visualizer.context.draw_debug_mesh(mesh, pos, T)
 
     @gs.assert_built
     def draw_debug_sphere(self, pos, radius=0.01, color=(1.0, 0.0, 0.0, 0.5)):
@@ -1257,8 +1260,8 @@ class Scene(RBC):
         node : genesis.ext.pyrender.mesh.Mesh
             The created debug object.
         """
-        with self._visualizer.viewer_lock:
-            return self._visualizer.context.draw_debug_sphere(pos, radius, color)
+        with self.visualizer.viewer_lock:
+            return self.visualizer.context.draw_debug_sphere(pos, radius, color)
 
     @gs.assert_built
     def draw_debug_spheres(self, poss, radius=0.01, color=(1.0, 0.0, 0.0, 0.5)):
@@ -1279,8 +1282,8 @@ class Scene(RBC):
         node : genesis.ext.pyrender.mesh.Mesh
             The created debug object.
         """
-        with self._visualizer.viewer_lock:
-            return self._visualizer.context.draw_debug_spheres(poss, radius, color)
+        with self.visualizer.viewer_lock:
+            return self.visualizer.context.draw_debug_spheres(poss, radius, color)
 
     @gs.assert_built
     def draw_debug_box(
@@ -1309,8 +1312,8 @@ class Scene(RBC):
         node : genesis.ext.pyrender.mesh.Mesh
             The created debug object.
         """
-        with self._visualizer.viewer_lock:
-            return self._visualizer.context.draw_debug_box(
+        with self.visualizer.viewer_lock:
+            return self.visualizer.context.draw_debug_box(
                 bounds, color, wireframe=wireframe, wireframe_radius=wireframe_radius
             )
 
@@ -1331,8 +1334,8 @@ class Scene(RBC):
         node : genesis.ext.pyrender.mesh.Mesh
             The created debug object.
         """
-        with self._visualizer.viewer_lock:
-            return self._visualizer.context.draw_debug_points(poss, colors)
+        with self.visualizer.viewer_lock:
+            return self.visualizer.context.draw_debug_points(poss, colors)
 
     @gs.assert_built
     def draw_debug_frustum(self, camera, color=(1.0, 1.0, 1.0, 0.3)):
@@ -1352,9 +1355,9 @@ class Scene(RBC):
         node : genesis.ext.pyrender.mesh.Mesh
             The created debug object.
         """
-        with self._visualizer.viewer_lock:
+        with self.visualizer.viewer_lock:
             mesh = mu.create_camera_frustum(camera, color)
-            return self._visualizer.context.draw_debug_mesh(mesh, T=camera.transform)
+            return self.visualizer.context.draw_debug_mesh(mesh, T=camera.transform)
 
     @gs.assert_built
     def draw_debug_trajectory(self, poss, radius=0.002, color=(1.0, 0.5, 0.0, 0.8)):
@@ -1382,8 +1385,8 @@ class Scene(RBC):
 
         segments = [mu.create_line(poss[i], poss[i + 1], radius, color) for i in range(len(poss) - 1)]
         merged = trimesh.util.concatenate(segments)
-        with self._visualizer.viewer_lock:
-            return self._visualizer.context.draw_debug_mesh(merged)
+        with self.visualizer.viewer_lock:
+            return self.visualizer.context.draw_debug_mesh(merged)
 
     @gs.assert_built
     def draw_debug_path(self, qposs, entity, link_idx=-1, density=0.3, frame_scaling=1.0):
@@ -1408,8 +1411,8 @@ class Scene(RBC):
 
         Returns
         -------
-        node : genesis.ext.pyrender.mesh.Mesh
-            The created debug object representing the visualized trajectory.
+        node : genesis.ext.pyrender.mesh.Mesh | None
+            The created debug object representing the visualized trajectory, or None if no point is sampled.
 
         Notes
         -----
@@ -1417,18 +1420,24 @@ class Scene(RBC):
         The density parameter reduces FK computational load by sampling fewer points, with 1.0 representing the whole
         trajectory.
         """
-        with self._visualizer.viewer_lock:
+        with self.visualizer.viewer_lock:
             N = len(qposs)
             density = np.clip(density, 0.0, 1.0)
             N_new = int(N * density)
-            indices = torch.linspace(0, N - 2, N_new, dtype=int)
-
-            Ts = np.zeros((N_new, 4, 4))
-            for i in range(N_new):
-                pos, quat = entity.forward_kinematics(qposs[indices[i]])
-                Ts[i] = tensor_to_array(gu.trans_quat_to_T(pos[link_idx], quat[link_idx]))
-
-            return self._visualizer.context.draw_debug_frames(
+            if N_new == 0:
+                return None
+            indices = torch.linspace(0, N - 2, N_new, dtype=gs.tc_int)
+
+            # The kernel only batches over environments, so samples go one by one, but the link poses are kept on
+            # device and converted to transforms all at once, with a single transfer back to host.
+            links_pos, links_quat = [], []
+            for i in indices.tolist():
+                pos, quat = entity.forward_kinematics(qposs[i])
+                links_pos.append(pos[link_idx])
+                links_quat.append(quat[link_idx])
+            Ts = gu.trans_quat_to_T(torch.stack(links_pos), torch.stack(links_quat))
+
+            return self.visualizer.context.draw_debug_frames(
                 Ts, axis_length=frame_scaling * 0.1, origin_size=0.001, axis_radius=frame_scaling * 0.005
             )
 
@@ -1466,16 +1475,35 @@ class Scene(RBC):
             otherwise a list of tensors of shape (n_envs, H, W) if depth is not None.
             If n_envs == 0, the first dimension of the tensor is squeezed.
         """
-        if self._visualizer.batch_renderer is None:
+        if self.visualizer.batch_renderer is None:
             gs.raise_exception("Method only supported by 'BatchRenderer'")
 
-        rgb_out, depth_out, seg_out, normal_out = self._visualizer.batch_renderer.render(
+        rgb_out, depth_out, seg_out, normal_out = self.visualizer.batch_renderer.render(
             rgb, depth, segmentation, normal, antialiasing, force_render
         )
         if segmentation and colorize_seg:
-            seg_out = tuple(self._visualizer.batch_renderer.colorize_seg_idxc_arr(seg) for seg in seg_out)
+            seg_out = tuple(self.visualizer.batch_renderer.colorize_seg_idxc_arr(seg) for seg in seg_out)
         return rgb_out, depth_out, seg_out, normal_out
 
+    @gs.assert_built
+    @contextlib.contextmanager
+    def debug_batch(self):
+        """
+        Hold the viewer lock for the whole block of debug drawing calls.
+
+        Each call still adds its own node, but the lock is acquired once instead of by every single call, so the
+        viewer thread cannot render in between and never shows a partially drawn block. Drawing many instances of the
+        same primitive is still best done with the vectorized variants, e.g. `draw_debug_spheres`.
+
+        Examples
+        --------
+        >>> with scene.debug_batch():
+        ...     for start, end in segments:
+        ...         scene.draw_debug_line(start, end)
+        """
+        with self.visualizer.viewer_lock:
+            yield
+
     @gs.assert_built
     def update_debug_objects(self, objs, poses):
         """
@@ -1490,24 +1518,24 @@ class Scene(RBC):
         poses : tuple of array_like, each of shape (4, 4)
             The new transformation matrices for each debug object.
         """
-        with self._visualizer.viewer_lock:
-            self._visualizer.context.update_debug_objects(objs, poses)
+        with self.visualizer.viewer_lock:
+            self.visualizer.context.update_debug_objects(objs, poses)
 
     @gs.assert_built
     def clear_debug_object(self, obj):
         """
         Clears the specified debug object from the scene.
         """
-        with self._visualizer.viewer_lock:
-            self._visualizer.context.clear_debug_object(obj)
+        with self.visualizer.viewer_lock:
+            self.visualizer.context.clear_debug_object(obj)
 
     @gs.assert_built
     def clear_debug_objects(self):
         """
         Clears all the debug objects in the scene.
         """
-        with self._visualizer.viewer_lock:
-            self._visualizer.context.clear_debug_objects()
+        with self.visualizer.viewer_lock:
+            self.visualizer.context.clear_debug_objects()
 
     def _backward(self):
         """
@@ -1536,57 +1564,44 @@ class Scene(RBC):
             Mapping ``"Class.attr[.member]" -> array`` with raw field data.
         """
         arrays: dict[str, np.ndarray] = {}
-
-        for name, value in self.__dict__.items():
-            if isinstance(value, (qd.Tensor, qd.Field, qd.Ndarray)):
-                arrays[".".join((self.__class__.__name__, name))] = value.to_numpy()
-
         for solver in self.active_solvers:
             arrays.update(solver.dump_ckpt_to_numpy())
 
         return arrays
 
-    def save_checkpoint(self, path: str | os.PathLike) -> None:
+    def save_checkpoint(self, path: str | os.PathLike, compress: bool = False) -> None:
         """
-        Pickle the full physics state to *one* file.
+        Save the full physics state to *one* NPZ archive.
 
         Parameters
         ----------
         path : str | os.PathLike
-            Destination filename.
-        """
-        state = {
-            "timestamp": time.time(),
-            "step_index": self.t,
-            "arrays": self.dump_ckpt_to_numpy(),
-        }
+            Destination filename. It is used as is, without appending any extension.
+        compress : bool, optional
+            Whether to deflate the arrays. Checkpoints of sparsely occupied or resting scenes typically get several
+            times smaller, at the cost of single-threaded compression on save and decompression on load, which is
+            slower than raw disk throughput on fast storage. Defaults to False.
+        """
+        arrays = self.dump_ckpt_to_numpy()
+        savez = np.savez_compressed if compress else np.savez
         with open(path, "wb") as f:
-            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            savez(f, timestamp=time.time(), step_index=self.t, **arrays)
 
     def load_checkpoint(self, path: str | os.PathLike) -> None:
         """
         Restore a file produced by :py:meth:`save_checkpoint`.
 
+        Arrays are read lazily from the archive, only when they match a field of an active solver.
+
         Parameters
         ----------
         path : str | os.PathLike
-            Path to the checkpoint pickle.
+            Path to the checkpoint archive.
         """
-        with open(path, "rb") as f:
-            state = pickle.load(f)
-
-        arrays = state["arrays"]
-
-        for name, value in self.__dict__.items():
-            if isinstance(value, (qd.Tensor, qd.Field, qd.Ndarray)):
-                key = ".".join((self.__class__.__name__, name))
-                if key in arrays:
-                    value.from_numpy(arrays[key])
-
-        for solver in self.active_solvers:
-            solver.load_ckpt_from_numpy(arrays)
-
-        self._t = state.get("step_index", self._t)
+        with np.load(path) as arrays:
+            for solver in self.active_solvers:
+                solver.load_ckpt_from_numpy(arrays)
+            self._t = int(arrays["step_index"])
 
     # ------------------------------------------------------------------------------------
     # ----------------------------------- utilities --------------------------------------
@@ -1601,10 +1616,21 @@ class Scene(RBC):
         if self.n_envs == 0:
             gs.raise_exception("`envs_idx` is not supported for non-parallelized scene.")
 
-        if isinstance(envs_idx, (slice, range)):
+        if isinstance(envs_idx, torch.Tensor):
+            # Indices that are already sanitized, typically forwarded from another API call, are returned as is
+            if (
+                envs_idx.ndim == 1
+                and envs_idx.dtype == gs.tc_int
+                and envs_idx.device == gs.device
+                and envs_idx.is_contiguous()
+            ):
+                return envs_idx
+        elif isinstance(envs_idx, (slice, range)):
             return self._envs_idx[envs_idx]
-        if isinstance(envs_idx, (int, np.integer)):
-            return self._envs_idx[envs_idx : envs_idx + 1]
+        elif isinstance(envs_idx, (int, np.integer)):
+            if not 0 <= envs_idx < self.n_envs:
+                gs.raise_exception(f"`envs_idx` out of range: {envs_idx}. Expecting value in [0, {self.n_envs}).")
+            return self._single_env_views[envs_idx]
 
         return sanitize_index(envs_idx, -1, self.n_envs, 0, "envs_idx")
 
@@ -1656,11 +1682,23 @@ class Scene(RBC):
     @property
     def viewer(self):
         """The viewer object for the scene."""
+        if self._visualizer is None:
+            return None
         return self._visualizer.viewer
 
     @property
     def visualizer(self):
-        """The visualizer object for the scene."""
+        """The visualizer object for the scene, constructed on first access in headless mode."""
+        if self._visualizer is None:
+            self._visualizer = Visualizer(
+                scene=self,
+                show_viewer=False,
+                vis_options=self.vis_options,
+                viewer_options=self.viewer_options,
+                renderer_options=self.renderer_options,
+            )
+            if self._is_built:
+                self._visualizer.build()
         return self._visualizer
 
     @property
@@ -1732,7 +1770,7 @@ class Scene(RBC):
             gs.raise_exception(f"Entity not found for uid: '{uid}'.")
 
     @property
-    def emitters(self):
+    def emitters(self) -> list["Emitter"]:
         """All the emitters in the scene."""
         return self._emitters
 
@@ -1784,4 +1822,4 @@ class Scene(RBC):
             - `(entity_id, link_id, geom_id)`
           depending on the material type and the configured segmentation level.
         """
-        return self._visualizer.segmentation_idx_dict
+        return self.visualizer.segmentation_idx_dict
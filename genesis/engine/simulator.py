@@ -407,7 +407,16 @@ class Simulator(RBC):
     # --------------------------------------- io -----------------------------------------
     # ------------------------------------------------------------------------------------
 
-    def get_state(self):
+    def get_state(self, *, out: SimState | None = None):
+        if out is not None:
+            # A reused state is overwritten on the next query, so it cannot take part in gradient collection.
+            if self._requires_grad:
+                gs.raise_exception("`out` is not supported when `requires_grad=True`.")
+            for solver, solver_state in zip(self._solvers, out.solvers_state):
+                solver.get_state(self.cur_substep_local, out=solver_state)
+            out._s_global = self.cur_step_global
+            return out
+
         state = SimState(
             scene=self.scene,
             s_global=self.cur_step_global,
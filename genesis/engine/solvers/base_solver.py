@@ -2,7 +2,7 @@ import dataclasses
 import enum
 import functools
 import inspect
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Mapping
 
 import quadrants as qd
 import numpy as np
@@ -267,14 +267,26 @@ class Solver(RBC):
         for attr_name, struct in self.data_manager.__dict__.items():
             yield from walk(f"{self.__class__.__name__}.data_manager.{attr_name}", struct)
 
+    @functools.cached_property
+    def _ckpt_fields(self) -> tuple[tuple[str, "qd.Tensor | qd.Field | qd.Ndarray"], ...]:
+        """(checkpoint key, field) for every field owned by the solver, collected once since they are all allocated
+        at build time."""
+        return tuple(
+            (".".join((self.__class__.__name__, attr_name)), value)
+            for attr_name, value in self.__dict__.items()
+            if isinstance(value, (qd.Tensor, qd.Field, qd.Ndarray))
+        )
+
+    @functools.cached_property
+    def _ckpt_data_manager_tensors(self) -> tuple[tuple[str, "qd.Tensor | qd.Field | qd.Ndarray"], ...]:
+        if self.data_manager is None:
+            return ()
+        return tuple(self._iter_data_manager_tensors())
+
     def dump_ckpt_to_numpy(self) -> dict[str, np.ndarray]:
         arrays: dict[str, np.ndarray] = {}
 
-        for attr_name, value in self.__dict__.items():
-            if not isinstance(value, (qd.Tensor, qd.Field, qd.Ndarray)):
-                continue
-
-            key_base = ".".join((self.__class__.__name__, attr_name))
+        for key_base, value in self._ckpt_fields:
             data = value.to_numpy()
 
             # StructField -> data is a dict: flatten each member
@@ -284,26 +296,22 @@ class Solver(RBC):
             else:
                 arrays[key_base] = data
 
-        if self.data_manager is not None:
-            for store_name, sub_arr in self._iter_data_manager_tensors():
-                arrays[store_name] = sub_arr.to_numpy()
+        for store_name, sub_arr in self._ckpt_data_manager_tensors:
+            arrays[store_name] = sub_arr.to_numpy()
 
         return arrays
 
-    def load_ckpt_from_numpy(self, arr_dict: dict[str, np.ndarray]) -> None:
-        for attr_name, value in self.__dict__.items():
-            if not isinstance(value, (qd.Tensor, qd.Field, qd.Ndarray)):
-                continue
-
-            key_base = ".".join((self.__class__.__name__, attr_name))
+    def load_ckpt_from_numpy(self, arr_dict: Mapping[str, np.ndarray]) -> None:
+        for key_base, value in self._ckpt_fields:
             member_prefix = key_base + "."
 
             # ---- StructField: gather its members -----------------------------
+            # Iterate over keys only, so that lazily loaded archives only read the matching arrays
             member_items = {}
-            for saved_key, saved_arr in arr_dict.items():
+            for saved_key in arr_dict:
                 if saved_key.startswith(member_prefix):
                     sub_name = saved_key[len(member_prefix) :]
-                    member_items[sub_name] = saved_arr
+                    member_items[sub_name] = arr_dict[saved_key]
 
             if member_items:  # we found at least one sub-member
                 value.from_numpy(member_items)
@@ -317,12 +325,11 @@ class Solver(RBC):
             value.from_numpy(arr)
 
         # if it has data_manager, add it to the arrays
-        if self.data_manager is not None:
-            for store_name, sub_arr in self._iter_data_manager_tensors():
-                if store_name in arr_dict:
-                    sub_arr.from_numpy(arr_dict[store_name])
-                else:
-                    gs.logger.warning(f"Failed to load {store_name}. Not found in stored arrays.")
+        for store_name, sub_arr in self._ckpt_data_manager_tensors:
+            if store_name in arr_dict:
+                sub_arr.from_numpy(arr_dict[store_name])
+            else:
+                gs.logger.warning(f"Failed to load {store_name}. Not found in stored arrays.")
 
     # ------------------------------------------------------------------------------------
     # ----------------------------------- properties -------------------------------------
@@ -1081,9 +1081,9 @@ class FEMSolver(Solver):
         if self.is_active:
             self._kernel_set_state(f, state.pos, state.vel, state.active)
 
-    def get_state(self, f):
+    def get_state(self, f, *, out: FEMSolverState | None = None):
         if self.is_active:
-            state = FEMSolverState(self._scene)
+            state = out if out is not None else FEMSolverState(self._scene)
             self._kernel_get_state(f, state.pos, state.vel, state.active)
         else:
             state = None
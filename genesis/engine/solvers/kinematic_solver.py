@@ -664,13 +664,16 @@ class KinematicSolver(Solver):
     # -------------------------------- state get/set -------------------------------------
     # ------------------------------------------------------------------------------------
 
-    def get_state(self, f=None):
+    def get_state(self, f=None, *, out: KinematicSolverState | None = None):
         if self.is_active:
             s_global = self.sim.cur_step_global
-            if s_global in self._queried_states:
+            if out is not None:
+                state = out
+                state._s_global = s_global
+            elif s_global in self._queried_states:
                 return self._queried_states[s_global][0]
-
-            state = KinematicSolverState(self._scene, s_global)
+            else:
+                state = KinematicSolverState(self._scene, s_global)
 
             kernel_get_kinematic_state(
                 state.i_pos_shift,
@@ -682,7 +685,8 @@ class KinematicSolver(Solver):
                 self.rigid_info,
                 self.rigid_config,
             )
-            self._queried_states.append(state)
+            if out is None:
+                self._queried_states.append(state)
         else:
             state = None
         return state
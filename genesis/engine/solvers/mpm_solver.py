@@ -850,11 +850,11 @@ class MPMSolver(Solver):
             self.particles[f, i_p, i_b].Jp = Jp[i_b, i_p]
             self.particles_ng[f, i_p, i_b].active = active[i_b, i_p]
 
-    def get_state(self, f):
+    def get_state(self, f, *, out: MPMSolverState | None = None):
         if not self.is_active:
             return None
 
-        state = MPMSolverState(self._scene)
+        state = out if out is not None else MPMSolverState(self._scene)
         self._kernel_get_state(f, state.pos, state.vel, state.C, state.F, state.Jp, state.active)
         return state
 
@@ -837,9 +837,9 @@ class PBDSolver(Solver):
                 self.particles[i_p, i_b].vel[j] = vel[i_b, i_p, j]
             self.particles[i_p, i_b].free = free[i_b, i_p]
 
-    def get_state(self, f):
+    def get_state(self, f, *, out: PBDSolverState | None = None):
         if self.is_active:
-            state = PBDSolverState(self.scene)
+            state = out if out is not None else PBDSolverState(self.scene)
             self._kernel_get_state(f, state.pos, state.vel, state.free)
         else:
             state = None
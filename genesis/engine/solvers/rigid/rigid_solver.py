@@ -1710,13 +1710,16 @@ class RigidSolver(KinematicSolver):
     # -------------------------------- state get/set -------------------------------------
     # ------------------------------------------------------------------------------------
 
-    def get_state(self, f=None):
+    def get_state(self, f=None, *, out: RigidSolverState | None = None):
         s_global = self.sim.cur_step_global
         if self.is_active:
-            if s_global in self._queried_states:
+            if out is not None:
+                state = out
+                state._s_global = s_global
+            elif s_global in self._queried_states:
                 return self._queried_states[s_global][0]
-
-            state = RigidSolverState(self._scene, s_global)
+            else:
+                state = RigidSolverState(self._scene, s_global)
 
             kernel_get_state(
                 state.i_pos_shift,
@@ -1731,7 +1734,8 @@ class RigidSolver(KinematicSolver):
                 self.rigid_info,
                 self.rigid_config,
             )
-            self._queried_states.append(state)
+            if out is None:
+                self._queried_states.append(state)
         else:
             state = None
         return state
@@ -288,7 +288,7 @@ class SFSolver(Solver):
     # --------------------------------------- io -----------------------------------------
     # ------------------------------------------------------------------------------------
 
-    def get_state(self, f):
+    def get_state(self, f, *, out=None):
         pass
 
     def set_state(self, f, state, envs_idx=None):
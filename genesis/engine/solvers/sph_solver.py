@@ -789,9 +789,9 @@ class SPHSolver(Solver):
                 self.particles[i_p, i_b].vel[j] = vel[i_b, i_p, j]
             self.particles_ng[i_p, i_b].active = active[i_b, i_p]
 
-    def get_state(self, f):
+    def get_state(self, f, *, out: SPHSolverState | None = None):
         if self.is_active:
-            state = SPHSolverState(self.scene)
+            state = out if out is not None else SPHSolverState(self.scene)
             self._kernel_get_state(f, state.pos, state.vel, state.active)
         else:
             state = None
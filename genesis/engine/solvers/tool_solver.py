@@ -63,9 +63,13 @@ class ToolSolver(Solver):
         for entity in self._entities:
             entity.reset_grad()
 
-    def get_state(self, f):
+    def get_state(self, f, *, out: ToolSolverState | None = None):
         if self.is_active:
-            state = ToolSolverState(self._scene)
+            if out is not None:
+                state = out
+                state.entities.clear()
+            else:
+                state = ToolSolverState(self._scene)
             for entity in self._entities:
                 state.entities.append(entity.get_state(f))
         else:
@@ -951,8 +951,8 @@ class JITRenderer:
                 if buffer_id >= 0:
                     gl.glBindBuffer(GL_ARRAY_BUFFER, buffer_id)
 
-                    gl.glBufferData(GL_ARRAY_BUFFER, buffer_size, address_to_ptr(0), GL_STREAM_DRAW)
-                    gl.glBufferSubData(GL_ARRAY_BUFFER, 0, buffer_size, address_to_ptr(buffer_addr))
+                    # Re-specifying the store with its data orphans the previous one and uploads in a single call
+                    gl.glBufferData(GL_ARRAY_BUFFER, buffer_size, address_to_ptr(buffer_addr), GL_STREAM_DRAW)
 
                     gl.glBindBuffer(GL_ARRAY_BUFFER, 0)
 
@@ -486,11 +486,16 @@ class Scene(object):
         if node.mesh is not None:
             self._bounds = None
 
-    def reorder_vertices(self, node, vertices):
+    def reorder_vertices(self, node, vertices, out=None):
         if node.mesh is None or len(node.mesh.primitives) != 1:
             raise ValueError("Node must have one primitive")
         primitive = node.mesh.primitives[0]
-        return vertices[primitive.vertex_mapping] if primitive.vertex_mapping is not None else vertices
+        if primitive.vertex_mapping is None:
+            return vertices
+        if out is None:
+            return vertices[primitive.vertex_mapping]
+        # The mapping is built from the mesh faces so it is always in range, and 'clip' writes into 'out' unbuffered
+        return np.take(vertices, primitive.vertex_mapping, axis=0, out=out, mode="clip")
 
     def clear(self):
         """Clear out all nodes to form an empty scene."""
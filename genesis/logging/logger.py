@@ -119,6 +119,9 @@ class Logger:
             self._logger.log(level, msg, *args, **kwargs)
 
     def debug(self, message):
+        # Debug messages are emitted from per-step code paths, so filtered ones must not take the timer lock
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
         with self.log_wrapper():
             self._logger.debug(message)
 
@@ -110,9 +110,8 @@ class Options(RBC, BaseModel):
         gs.raise_exception_from(trace_msg, None)
 
     def model_copy_from(self, other: BaseModel, override: bool = False) -> Self:
-        self_fields = set(self.__class__.model_fields)
-        other_dump = other.model_dump()
-        other_dump = {k: v for k, v in other_dump.items() if k in self_fields}
+        # Only serialize the fields in common, as the source options may be much larger than the destination ones
+        other_dump = other.model_dump(include=set(self.__class__.model_fields))
         self_dump = self.model_dump()
         # Do not include default None
         for field, value in tuple(self_dump.items()):
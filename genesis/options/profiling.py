@@ -13,7 +13,14 @@ class ProfilingOptions(Options):
         Whether to show the frame rate each step. Default true
     FPS_tracker_alpha: float
         Exponential decay momentum for FPS moving average
+    eager_compile : bool
+        Whether to compile the simulation kernels while building the scene, by running one warm-up step followed by a
+        reset. It makes the first call to `scene.step` as fast as the next ones and keeps compilation time out of step
+        timings, at the cost of an extra step and state reset during build. If False, kernels are compiled the first
+        time they are actually invoked, which shortens `scene.build` when the scene is discarded early or only queried.
+        Default true
     """
 
     show_FPS: StrictBool = True
     FPS_tracker_alpha: float = 0.95
+    eager_compile: StrictBool = True
@@ -31,7 +31,10 @@ class SimOptions(Options):
     substeps : int, optional
         Number of substeps per simulation step. Defaults to 1.
     substeps_local : int, optional
-        Number of substeps stored in GPU memory. Defaults to None. This is used for differentiable mode.
+        Number of substeps stored in GPU memory. Defaults to None. In differentiable mode, trajectories are split into
+        segments of `substeps_local` substeps. GPU memory is bounded by the segment length, while host memory grows
+        with the number of segments. Larger values make backpropagation faster and use less host memory, at the cost
+        of GPU memory growing linearly with it. Pick the largest value that fits in GPU memory.
     gravity : tuple, optional
         Gravity force in N/kg. Defaults to (0.0, 0.0, -9.81).
     floor_height : float, optional
@@ -13,6 +13,8 @@ class RBC:
     (decorated by @property) of the class, ordered by length of the property name.
     """
 
+    __slots__ = ()
+
     def __repr_name__(self):
         cls = type(self)
         class_name = cls.__qualname__
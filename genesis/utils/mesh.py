@@ -1170,6 +1170,29 @@ def create_line(start, end, radius=0.002, color=(1.0, 1.0, 1.0, 1.0), sections=1
     return mesh
 
 
+@lru_cache(maxsize=32)
+def _create_axis_impl(origin_size, axis_radius, axis_length):
+    mesh = trimesh.creation.axis(origin_size=origin_size, axis_radius=axis_radius, axis_length=axis_length)
+    vertices, faces, vertex_colors = mesh.vertices.copy(), mesh.faces.copy(), mesh.visual.vertex_colors.copy()
+    attrs = {"vertex_normals": mesh.vertex_normals.copy(), "face_normals": mesh.face_normals.copy()}
+    for data in (vertices, faces, vertex_colors, *attrs.values()):
+        data.flags.writeable = False
+    return vertices, faces, vertex_colors, attrs
+
+
+def create_axis(origin_size=0.015, axis_radius=0.01, axis_length=1.0, color=None):
+    vertices, faces, vertex_colors, attrs = _create_axis_impl(origin_size, axis_radius, axis_length)
+    visual = trimesh.visual.ColorVisuals()
+    if color is None:
+        visual._data["vertex_colors"] = vertex_colors.copy()
+    else:
+        visual._data["vertex_colors"] = np.tile(color_f32_to_u8(color), (len(vertices), 1))
+    mesh = trimesh.Trimesh(vertices=vertices.copy(), faces=faces, visual=visual, process=False)
+    mesh._cache.id_set()
+    mesh._cache.cache.update(attrs)
+    return mesh
+
+
 @lru_cache(maxsize=1)
 def _create_unit_box_impl():
     mesh = trimesh.creation.box(extents=[1.0, 1.0, 1.0])
@@ -775,8 +775,8 @@ def qd_to_numpy(
     elif gs.backend != gs.cpu:
         if copy is False:
             gs.raise_exception("Specifying 'copy=False' is not supported by this method if 'gs.backend != gs.cpu'.")
-        array = tensor_to_array(qd_to_torch(value, transpose=transpose))
-        is_copy = True
+        # Masks are applied on device so that only the selected entries are transferred to host
+        return tensor_to_array(qd_to_torch(value, row_mask, col_mask, keepdim, transpose))
     else:
         try:
             array = value._T_np if transpose else value._np
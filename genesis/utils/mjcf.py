@@ -1,8 +1,10 @@
 import os
+import logging
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from itertools import chain
 from bisect import bisect_right
+from contextlib import ExitStack
 
 # Note the importing mujoco with env var `MUJOCO_GL=EGL` forcibly defines `PYOPENGL_PLATFORM=egl`
 import mujoco
@@ -222,7 +224,11 @@ def build_model(
                 # Mujoco MJCF parser to determine how to load mesh files.
                 elem.set("filename", str(Path(asset_path) / mesh_path))
 
-        with open(os.devnull, "w") as stderr, redirect_libc_stderr(stderr):
+        with ExitStack() as stack:
+            # Mujoco diagnostics are mostly noise, yet they help to track down parsing issues when debugging
+            if gs.logger.level > logging.DEBUG:
+                stack.enter_context(redirect_libc_stderr(stack.enter_context(open(os.devnull, "w"))))
+
             # Parse updated URDF file as a string
             data = ET.tostring(root, encoding="utf8")
             mj = mujoco.MjModel.from_xml_string(data)
@@ -195,9 +195,13 @@ class FPSTracker:
     """
 
     def __init__(self, n_envs, alpha=0.95, minimum_interval_seconds: float | None = 0.05):
-        self.n_envs = n_envs
         self.alpha = alpha
         self.minimum_interval_seconds = minimum_interval_seconds
+        self.reset(n_envs)
+
+    def reset(self, n_envs):
+        """Discard the current estimate and start tracking anew for the given number of environments."""
+        self.n_envs = n_envs
         self.window_start = None
         self.steps_since_last_print: int = 0
         self.fps_ema = None
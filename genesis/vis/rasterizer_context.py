@@ -1,3 +1,4 @@
+import numba as nb
 import numpy as np
 import torch
 import trimesh
@@ -11,6 +12,14 @@ from genesis.ext.pyrender.jit_render import JITRenderer
 from genesis.utils.misc import tensor_to_array, qd_to_numpy
 
 
+@nb.jit(nopython=True, cache=True)
+def _seg_idxc_rgb_to_idxc(seg_idxc_rgb, out):
+    for i in range(seg_idxc_rgb.shape[0]):
+        out[i] = (
+            (np.int32(seg_idxc_rgb[i, 0]) << 16) | (np.int32(seg_idxc_rgb[i, 1]) << 8) | np.int32(seg_idxc_rgb[i, 2])
+        )
+
+
 class SegmentationColorMap:
     def __init__(self, seed: int = 0, to_torch: bool = False):
         self.seed = seed
@@ -28,7 +37,10 @@ class SegmentationColorMap:
         return self.idxc_map[seg_idxc]
 
     def colorize_seg_idxc_arr(self, seg_idxc_arr):
-        return self.idxc_to_color[seg_idxc_arr]
+        if self.to_torch:
+            return self.idxc_to_color[seg_idxc_arr]
+        # Gathering whole rows with 'take' skips the generic fancy-indexing machinery on full-resolution images
+        return np.take(self.idxc_to_color, seg_idxc_arr, axis=0)
 
     def generate_seg_colors(self):
         # seg_key: same as entity/link/geom's idx
@@ -106,11 +118,23 @@ class RasterizerContext:
         self.vverts_nodes = dict()
         self._per_env_vverts_entity_uids: set = set()
         self.static_nodes = dict()  # used across all frames
+        # (env_idx, entity.uid) -> transposed single-precision instance transforms of particle-mode static nodes
+        self._particles_tfs_t = dict()
+        # vgeom.uid -> simulation vertex indices of FEM visual geoms, composed with their render vertex mapping
+        self._fem_render_verts_idx = dict()
+        # node -> reordered vertex buffer reused across frames by the node's position updates
+        self._reordered_verts = dict()
         self.dynamic_nodes = dict()  # nodes that live within single frame
         self.external_nodes = dict()  # nodes added by external user
         self.seg_node_map = dict()
+        # seg_idxc -> read-only packed RGB color, shared by all the nodes of an object across environments
+        self._seg_idxc_to_idxc_rgb = dict()
         self.seg_color_map = SegmentationColorMap()
 
+        # per-link contact visualization flags and arrow scales, constant after build
+        self._links_visualize_contact = np.zeros(0, dtype=np.bool_)
+        self._links_init_AABB_size = np.zeros(0, dtype=gs.np_float)
+
         self.init_meshes()
 
     def init_meshes(self):
@@ -161,6 +185,7 @@ class RasterizerContext:
 
         self.on_tool()
         self.on_rigid()
+        self.on_contact()
         self.on_mpm()
         self.on_sph()
         self.on_pbd()
@@ -183,6 +208,9 @@ class RasterizerContext:
             for external_node in node_registry.values():
                 self.remove_node(external_node)
             node_registry.clear()
+        self._particles_tfs_t.clear()
+        self._fem_render_verts_idx.clear()
+        self._reordered_verts.clear()
         self._per_env_vverts_entity_uids.clear()
 
     def reset(self):
@@ -193,12 +221,25 @@ class RasterizerContext:
             return self._scene.add(obj, **kwargs)
 
     def remove_node(self, node):
+        self._reordered_verts.pop(node, None)
         if self.scene._visualizer is None:
             self._scene.remove_node(node)
         else:
             with self.scene._visualizer.viewer_lock:
                 self._scene.remove_node(node)
 
+    def _reorder_vertices(self, node, vertices):
+        # The reordered vertices of a node are written into the same buffer every frame. This is safe because context
+        # updates hold the viewer lock, under which the viewer thread flushes queued uploads, and the upload queue only
+        # keeps the latest data of each buffer.
+        vertex_mapping = node.mesh.primitives[0].vertex_mapping
+        if vertex_mapping is None:
+            return vertices
+        out = self._reordered_verts.get(node)
+        if out is None:
+            out = self._reordered_verts[node] = np.empty((len(vertex_mapping), 3), dtype=np.float32)
+        return self._scene.reorder_vertices(node, vertices, out=out)
+
     def _get_geom_active_envs_idx(self, geom, rendered_envs_idx):
         """Get the intersection of geom.active_envs_idx (for heterogeneous sim) and rendered_envs_idx.
 
@@ -386,16 +427,9 @@ class RasterizerContext:
                     self.set_node_pose(self.static_nodes[(idx, tool_entity.uid)], pose=pose)
 
     def set_reflection_mat(self, geom_T):
-        height = geom_T[0, 2, 3]
-        self.jit.reflection_mat = np.array(
-            [
-                [1.0, 0.0, 0.0, 0.0],
-                [0.0, 1.0, 0.0, 0.0],
-                [0.0, 0.0, -1.0, height * 2],
-                [0.0, 0.0, 0.0, 1.0],
-            ],
-            dtype=np.float32,
-        )
+        # The renderer initializes the reflection matrix to identity, and only the mirror plane height varies
+        self.jit.reflection_mat[2, 2] = -1.0
+        self.jit.reflection_mat[2, 3] = 2.0 * geom_T[0, 2, 3]
 
     def _rigid_solvers(self):
         """Yield active solvers that manage KinematicEntity-based entities (rigid + kinematic)."""
@@ -418,6 +452,9 @@ class RasterizerContext:
                 else:
                     geoms = entity.geoms
                     geoms_T = solver._geoms_render_T
+                is_sdf = "sdf" in entity.surface.vis_mode
+                is_collision = "collision" in entity.surface.vis_mode
+                is_floor = isinstance(entity._morph, gs.morphs.Plane)
 
                 for geom in geoms:
                     # For heterogeneous simulation, filter envs based on geom's assigned environments
@@ -425,7 +462,7 @@ class RasterizerContext:
                     if len(geom_envs_idx) == 0:
                         continue
 
-                    if "sdf" in entity.surface.vis_mode:
+                    if is_sdf:
                         mesh = geom.get_sdf_trimesh()
                     else:
                         mesh = geom.get_trimesh()
@@ -457,34 +494,35 @@ class RasterizerContext:
                     mesh_node = pyrender.Mesh.from_trimesh(
                         mesh=mesh,
                         poses=geom_T,
-                        smooth=geom.surface.smooth if "collision" not in entity.surface.vis_mode else False,
-                        double_sided=(
-                            geom.surface.double_sided if "collision" not in entity.surface.vis_mode else False
-                        ),
-                        is_floor=isinstance(entity._morph, gs.morphs.Plane),
+                        smooth=geom.surface.smooth if not is_collision else False,
+                        double_sided=geom.surface.double_sided if not is_collision else False,
+                        is_floor=is_floor,
                         env_shared=env_shared,
                         active_envs=active_envs,
                         material=vis_materials.get(surface_key),
                     )
                     vis_materials.setdefault(surface_key, mesh_node.primitives[0].material)
                     self.add_rigid_node(geom, mesh_node)
-                    if isinstance(entity._morph, gs.morphs.Plane):
+                    if is_floor:
                         self.set_reflection_mat(geom_T)
 
     def update_rigid(self):
+        envs_offset = self.scene.envs_offset
         for solver in self._rigid_solvers():
+            vverts = None
             for entity in solver.entities:
                 if entity.surface.vis_mode == "visual":
                     geoms = entity.vgeoms
                     geoms_T = solver._vgeoms_render_T
                     if entity._morph.enable_custom_vverts:
+                        # All the entities with custom vverts of a solver share a single device-to-host copy
+                        if vverts is None:
+                            vverts = qd_to_numpy(solver.dyn_state.vverts.pos, self.rendered_envs_idx, transpose=True)
+                        custom_offset = entity._custom_vvert_start - entity._vvert_start
                         if entity.uid not in self._per_env_vverts_entity_uids:
                             # Seed primitive.positions with the current world-space vverts: buffer updates bypass
                             # primitive.positions, which keeps feeding the scene bounds (shadow map extents), so it
                             # must hold world-space data.
-                            vverts = qd_to_numpy(solver.dyn_state.vverts.pos, self.rendered_envs_idx, transpose=True)
-                            envs_offset = self.scene.envs_offset
-                            custom_offset = entity._custom_vvert_start - entity._vvert_start
                             for geom in entity.vgeoms:
                                 old_node = self.rigid_nodes.pop(geom.uid, None)
                                 if old_node is not None:
@@ -509,7 +547,7 @@ class RasterizerContext:
                                     env_i = self.rendered_envs_idx.index(i_b)
                                     geom_vverts = vverts[env_i, v_start:v_end, :] + envs_offset[i_b]
                                     node.mesh.primitives[0].positions = self._scene.reorder_vertices(
-                                        node, geom_vverts.astype(np.float32)
+                                        node, geom_vverts.astype(np.float32, copy=False)
                                     )
                                     self.vverts_nodes[(i_b, geom.uid)] = node
                                     if self.segmentation_level == "geom":
@@ -523,9 +561,6 @@ class RasterizerContext:
                                     self.create_node_seg(seg_key, node)
                             self._per_env_vverts_entity_uids.add(entity.uid)
 
-                        vverts = qd_to_numpy(solver.dyn_state.vverts.pos, self.rendered_envs_idx, transpose=True)
-                        envs_offset = self.scene.envs_offset
-                        custom_offset = entity._custom_vvert_start - entity._vvert_start
                         for geom in entity.vgeoms:
                             geom_envs_idx = self._get_geom_active_envs_idx(geom, self.rendered_envs_idx)
                             if len(geom_envs_idx) == 0:
@@ -537,7 +572,7 @@ class RasterizerContext:
                                     continue
                                 node = self.vverts_nodes[(i_b, geom.uid)]
                                 geom_vverts = vverts[env_i, v_start:v_end, :] + envs_offset[i_b]
-                                update_data = self._scene.reorder_vertices(node, geom_vverts.astype(np.float32))
+                                update_data = self._reorder_vertices(node, geom_vverts.astype(np.float32, copy=False))
                                 self.jit.update_buffer(node, "pos", update_data)
                                 normal_data = self.jit.update_normal(node, update_data)
                                 if normal_data is not None:
@@ -547,6 +582,18 @@ class RasterizerContext:
                     geoms = entity.geoms
                     geoms_T = solver._geoms_render_T
 
+                # Keep single-instance for z-axis normal planes (see on_rigid)
+                is_single_instance = False
+                if isinstance(entity.main_morph, gs.morphs.Plane):
+                    plane_normal, plane_size = entity.main_morph.normal, entity.main_morph.plane_size
+                    is_single_instance = (
+                        abs(plane_normal[0]) < gs.EPS
+                        and abs(plane_normal[1]) < gs.EPS
+                        and self.scene.env_spacing[0] < plane_size[0]
+                        and self.scene.env_spacing[1] < plane_size[1]
+                    )
+                is_floor = isinstance(entity._morph, gs.morphs.Plane)
+
                 for geom in geoms:
                     # Skip geoms that weren't added - in heterogeneous simulation, some geoms
                     # may not be rendered in any of the requested environments
@@ -558,42 +605,40 @@ class RasterizerContext:
                     if len(geom_envs_idx) == 0:
                         continue
 
-                    # Mirror on_rigid: full per-env poses for env-masked variants, compacted otherwise.
+                    # Mirror on_rigid: full per-env poses for env-masked variants, compacted otherwise. Gathering from
+                    # the transposed view directly yields the contiguous layout uploaded to the instance buffer.
                     if len(geom_envs_idx) < len(self.rendered_envs_idx):
-                        geom_T = geoms_T[geom.idx][self.rendered_envs_idx]
+                        geom_T_t = geoms_T[geom.idx].transpose((0, 2, 1))[self.rendered_envs_idx]
                     else:
-                        geom_T = geoms_T[geom.idx][geom_envs_idx]
+                        geom_T_t = geoms_T[geom.idx].transpose((0, 2, 1))[geom_envs_idx]
 
-                    # Keep single-instance for z-axis normal planes (see on_rigid)
-                    if isinstance(entity.main_morph, gs.morphs.Plane):
-                        plane_normal, plane_size = entity.main_morph.normal, entity.main_morph.plane_size
-                        if (
-                            abs(plane_normal[0]) < gs.EPS
-                            and abs(plane_normal[1]) < gs.EPS
-                            and self.scene.env_spacing[0] < plane_size[0]
-                            and self.scene.env_spacing[1] < plane_size[1]
-                        ):
-                            geom_T = geom_T[:1]
+                    if is_single_instance:
+                        geom_T_t = geom_T_t[:1]
 
+                    geom_T = geom_T_t.transpose((0, 2, 1))
                     node = self.rigid_nodes[geom.uid]
                     node.mesh._bounds = None
                     node.mesh.primitives[0].poses = geom_T
-                    self.jit.update_buffer(node, "model", geom_T.transpose((0, 2, 1)))
-                    if isinstance(entity._morph, gs.morphs.Plane):
+                    self.jit.update_buffer(node, "model", geom_T_t)
+                    if is_floor:
                         self.set_reflection_mat(geom_T)
 
-    def update_contact(self):
-        if self.sim.rigid_solver.is_active and any(link.visualize_contact for link in self.sim.rigid_solver.links):
-            # Extract all contact information at once
-            contacts_info_all = self.sim.rigid_solver.collider.get_contacts(as_tensor=False, to_torch=False)
+    def on_contact(self):
+        if self.sim.rigid_solver.is_active:
+            rigid_solver = self.sim.rigid_solver
+            self._links_visualize_contact = np.array(
+                [link.visualize_contact for link in rigid_solver.links], dtype=np.bool_
+            )
+            if not self._links_visualize_contact.any():
+                return
 
             # Scale contact arrows by the parent link's overall size rather than the individual contacting geom, so
             # they stay legible on links built from many small convex-decomposition pieces. The per-geom init AABBs
             # are in each geom's local frame, so offset their corners by the geom pose to get the link-frame extent.
             # This diagonal is constant, so compute it once and cache it.
-            geoms_aabb = qd_to_numpy(self.sim.rigid_solver.geoms_init_AABB)
-            links_init_AABB_size = np.zeros(self.sim.rigid_solver.n_links, dtype=gs.np_float)
-            for link in self.sim.rigid_solver.links:
+            geoms_aabb = qd_to_numpy(rigid_solver.geoms_init_AABB)
+            self._links_init_AABB_size = np.zeros(rigid_solver.n_links, dtype=gs.np_float)
+            for link in rigid_solver.links:
                 if link.n_geoms == 0:
                     continue
                 lower = np.full(3, np.inf, dtype=gs.np_float)
@@ -602,8 +647,15 @@ class RasterizerContext:
                     corners = gu.transform_by_trans_quat(geoms_aabb[geom.idx], geom.init_pos, geom.init_quat)
                     lower = np.minimum(lower, corners.min(axis=0))
                     upper = np.maximum(upper, corners.max(axis=0))
-                links_init_AABB_size[link.idx] = np.linalg.norm(upper - lower)
+                self._links_init_AABB_size[link.idx] = np.linalg.norm(upper - lower)
+
+    def update_contact(self):
+        if self.sim.rigid_solver.is_active and self._links_visualize_contact.any():
+            # Extract all contact information at once
+            contacts_info_all = self.sim.rigid_solver.collider.get_contacts(as_tensor=False, to_torch=False)
 
+            # Without per-env views, every arrow of a given kind is drawn as an instance of a single node
+            contact_pos_drawn, contact_force_drawn, contact_normal_drawn, radius_drawn = [], [], [], []
             for env_i, batch_idx in enumerate(self.rendered_envs_idx):
                 if self.sim.rigid_solver.n_envs > 0:
                     contacts_info = {key: value[batch_idx] for key, value in contacts_info_all.items()}
@@ -614,17 +666,23 @@ class RasterizerContext:
                 if n_contacts == 0:
                     continue
 
-                la_size = links_init_AABB_size[contacts_info["link_a"]]
-                lb_size = links_init_AABB_size[contacts_info["link_b"]]
+                la_size = self._links_init_AABB_size[contacts_info["link_a"]]
+                lb_size = self._links_init_AABB_size[contacts_info["link_b"]]
                 arrow_scale = np.minimum(la_size, lb_size)
                 radius = np.minimum(arrow_scale * 0.04, 0.005)
                 contact_pos = contacts_info["position"] + self.scene.envs_offset[batch_idx]
                 contact_normal_scaled = contacts_info["normal"] * arrow_scale[:, None]
                 contact_force = contacts_info["force"]
 
-                for i_c in range(n_contacts):
-                    for link_idx, sign in ((contacts_info["link_a"][i_c], -1), (contacts_info["link_b"][i_c], 1)):
-                        if self.sim.rigid_solver.links[link_idx].visualize_contact:
+                for contact_links, sign in ((contacts_info["link_a"], -1), (contacts_info["link_b"], 1)):
+                    contacts_idx = np.flatnonzero(self._links_visualize_contact[contact_links])
+                    if not self.env_separate_rigid:
+                        contact_pos_drawn.append(contact_pos[contacts_idx])
+                        contact_force_drawn.append(sign * contact_force[contacts_idx])
+                        contact_normal_drawn.append(-sign * contact_normal_scaled[contacts_idx])
+                        radius_drawn.append(radius[contacts_idx])
+                    else:
+                        for i_c in contacts_idx.tolist():
                             self.draw_contact_arrow(
                                 pos=contact_pos[i_c], radius=radius[i_c], force=sign * contact_force[i_c], env_idx=env_i
                             )
@@ -637,20 +695,53 @@ class RasterizerContext:
                                 env_idx=env_i,
                             )
 
+            if contact_pos_drawn:
+                contact_pos_drawn = np.concatenate(contact_pos_drawn)
+                radius_drawn = np.concatenate(radius_drawn)
+                self.draw_debug_arrows(
+                    contact_pos_drawn,
+                    np.concatenate(contact_force_drawn) * self.contact_force_scale,
+                    radius_drawn,
+                    color=(0.0, 0.9, 0.8, 1.0),
+                    persistent=False,
+                )
+                self.draw_debug_arrows(
+                    contact_pos_drawn,
+                    np.concatenate(contact_normal_drawn),
+                    radius_drawn,
+                    color=(0.9, 0.0, 0.8, 1.0),
+                    persistent=False,
+                )
+
     def on_mpm(self):
         if self.sim.mpm_solver.is_active:
             for mpm_entity in self.sim.mpm_solver.entities:
-                if mpm_entity.surface.vis_mode in ("recon", "visual"):
+                if mpm_entity.surface.vis_mode == "recon":
                     self.add_dynamic_node(mpm_entity, None)
+                elif mpm_entity.surface.vis_mode == "visual":
+                    # The visual mesh keeps its topology, so a persistent node per env has its vertices updated in
+                    # place. It is seeded from the initial visual mesh, since render fields are only computed later on.
+                    for idx in self.rendered_envs_idx:
+                        mesh = trimesh.Trimesh(
+                            mpm_entity.vmesh.verts + self.scene.envs_offset[idx],
+                            mpm_entity.vmesh.faces,
+                            process=False,
+                        )
+                        mesh.visual = mpm_entity.vmesh.trimesh.visual
+                        self.add_static_node(
+                            mpm_entity, pyrender.Mesh.from_trimesh(mesh, smooth=mpm_entity.surface.smooth), i_b=idx
+                        )
                 elif mpm_entity.surface.vis_mode == "particle":
+                    # The sphere template is identical across environments, and pyrender copies it on upload
+                    mesh = mu.create_sphere(
+                        self.sim.mpm_solver.particle_radius * self.particle_size_scale, subdivisions=1
+                    )
+                    mesh.visual = mu.surface_uvs_to_trimesh_visual(mpm_entity.surface, n_verts=len(mesh.vertices))
                     for idx in self.rendered_envs_idx:
-                        mesh = mu.create_sphere(
-                            self.sim.mpm_solver.particle_radius * self.particle_size_scale, subdivisions=1
+                        tfs = gu.trans_to_T(mpm_entity.init_particles)
+                        self._particles_tfs_t[(idx, mpm_entity.uid)] = np.ascontiguousarray(
+                            tfs.transpose((0, 2, 1)), dtype=np.float32
                         )
-                        mesh.visual = mu.surface_uvs_to_trimesh_visual(mpm_entity.surface, n_verts=len(mesh.vertices))
-
-                        tfs = np.tile(np.eye(4), (mpm_entity.n_particles, 1, 1))
-                        tfs[:, :3, 3] = mpm_entity.init_particles
                         self.add_static_node(
                             mpm_entity, pyrender.Mesh.from_trimesh(mesh, smooth=True, poses=tfs), i_b=idx
                         )
@@ -674,15 +765,21 @@ class RasterizerContext:
 
     def update_mpm(self):
         if self.sim.mpm_solver.is_active:
-            particles_all = qd_to_numpy(self.sim.mpm_solver.particles_render.pos) + self.scene.envs_offset
-            active_all = qd_to_numpy(self.sim.mpm_solver.particles_render.active).astype(dtype=np.bool_, copy=False)
-            vverts_all = qd_to_numpy(self.sim.mpm_solver.vverts_render.pos) + self.scene.envs_offset
+            # Only the rendered envs are gathered and offset
+            envs_offset = self.scene.envs_offset[self.rendered_envs_idx]
+            particles_all = (
+                qd_to_numpy(self.sim.mpm_solver.particles_render.pos, None, self.rendered_envs_idx) + envs_offset
+            )
+            active_all = qd_to_numpy(self.sim.mpm_solver.particles_render.active, None, self.rendered_envs_idx).astype(
+                dtype=np.bool_, copy=False
+            )
+            vverts_all = qd_to_numpy(self.sim.mpm_solver.vverts_render.pos, None, self.rendered_envs_idx) + envs_offset
             for mpm_entity in self.sim.mpm_solver.entities:
-                for idx in self.rendered_envs_idx:
+                for env_i, idx in enumerate(self.rendered_envs_idx):
                     if mpm_entity.surface.vis_mode == "recon":
                         mesh = pu.particles_to_mesh(
-                            positions=particles_all[mpm_entity.particle_start : mpm_entity.particle_end, idx][
-                                active_all[mpm_entity.particle_start : mpm_entity.particle_end, idx]
+                            positions=particles_all[mpm_entity.particle_start : mpm_entity.particle_end, env_i][
+                                active_all[mpm_entity.particle_start : mpm_entity.particle_end, env_i]
                             ],
                             radius=self.sim.mpm_solver.particle_radius,
                             backend=mpm_entity.surface.recon_backend,
@@ -690,20 +787,21 @@ class RasterizerContext:
                         mesh.visual = mu.surface_uvs_to_trimesh_visual(mpm_entity.surface, n_verts=len(mesh.vertices))
                         self.add_dynamic_node(mpm_entity, pyrender.Mesh.from_trimesh(mesh, smooth=True))
                     elif mpm_entity.surface.vis_mode == "particle":
-                        tfs = np.tile(np.eye(4), (mpm_entity.n_particles, 1, 1))
-                        tfs[:, :3, 3] = particles_all[mpm_entity.particle_start : mpm_entity.particle_end, idx]
+                        # Only the translations change across frames, so they are written into the persistent buffer
+                        tfs_t = self._particles_tfs_t[(idx, mpm_entity.uid)]
+                        tfs_t[:, 3, :3] = particles_all[mpm_entity.particle_start : mpm_entity.particle_end, env_i]
 
                         node = self.static_nodes[(idx, mpm_entity.uid)]
-                        self.jit.update_buffer(node, "model", tfs.transpose((0, 2, 1)))
+                        self.jit.update_buffer(node, "model", tfs_t)
 
                     elif mpm_entity.surface.vis_mode == "visual":
-                        mpm_entity._vmesh.trimesh.vertices = vverts_all[
-                            mpm_entity.vvert_start : mpm_entity.vvert_end, idx
-                        ]
-                        self.add_dynamic_node(
-                            mpm_entity,
-                            pyrender.Mesh.from_trimesh(mpm_entity.vmesh.trimesh, smooth=mpm_entity.surface.smooth),
-                        )
+                        node = self.static_nodes[(idx, mpm_entity.uid)]
+                        render_verts = vverts_all[mpm_entity.vvert_start : mpm_entity.vvert_end, env_i]
+                        update_data = self._reorder_vertices(node, render_verts.astype(np.float32, copy=False))
+                        self.jit.update_buffer(node, "pos", update_data)
+                        normal_data = self.jit.update_normal(node, update_data)
+                        if normal_data is not None:
+                            self.jit.update_buffer(node, "normal", normal_data)
 
     def on_sph(self):
         if self.sim.sph_solver.is_active:
@@ -711,14 +809,16 @@ class RasterizerContext:
                 if sph_entity.surface.vis_mode == "recon":
                     self.add_dynamic_node(sph_entity, None)
                 elif sph_entity.surface.vis_mode == "particle":
+                    # The sphere template is identical across environments, and pyrender copies it on upload
+                    mesh = mu.create_sphere(
+                        self.sim.sph_solver.particle_radius * self.particle_size_scale, subdivisions=1
+                    )
+                    mesh.visual = mu.surface_uvs_to_trimesh_visual(sph_entity.surface, n_verts=len(mesh.vertices))
                     for idx in self.rendered_envs_idx:
-                        mesh = mu.create_sphere(
-                            self.sim.sph_solver.particle_radius * self.particle_size_scale, subdivisions=1
+                        tfs = gu.trans_to_T(sph_entity.init_particles)
+                        self._particles_tfs_t[(idx, sph_entity.uid)] = np.ascontiguousarray(
+                            tfs.transpose((0, 2, 1)), dtype=np.float32
                         )
-                        mesh.visual = mu.surface_uvs_to_trimesh_visual(sph_entity.surface, n_verts=len(mesh.vertices))
-
-                        tfs = np.tile(np.eye(4), (sph_entity.n_particles, 1, 1))
-                        tfs[:, :3, 3] = sph_entity.init_particles
                         self.add_static_node(
                             sph_entity, pyrender.Mesh.from_trimesh(mesh, smooth=True, poses=tfs), i_b=idx
                         )
@@ -742,15 +842,21 @@ class RasterizerContext:
 
     def update_sph(self):
         if self.sim.sph_solver.is_active:
-            particles_all = qd_to_numpy(self.sim.sph_solver.particles_render.pos) + self.scene.envs_offset
-            active_all = qd_to_numpy(self.sim.sph_solver.particles_render.active).astype(dtype=np.bool_, copy=False)
+            # Only the rendered envs are gathered and offset
+            envs_offset = self.scene.envs_offset[self.rendered_envs_idx]
+            particles_all = (
+                qd_to_numpy(self.sim.sph_solver.particles_render.pos, None, self.rendered_envs_idx) + envs_offset
+            )
+            active_all = qd_to_numpy(self.sim.sph_solver.particles_render.active, None, self.rendered_envs_idx).astype(
+                dtype=np.bool_, copy=False
+            )
 
             for sph_entity in self.sim.sph_solver.entities:
-                for idx in self.rendered_envs_idx:
+                for env_i, idx in enumerate(self.rendered_envs_idx):
                     if sph_entity.surface.vis_mode == "recon":
                         mesh = pu.particles_to_mesh(
-                            positions=particles_all[sph_entity.particle_start : sph_entity.particle_end, idx][
-                                active_all[sph_entity.particle_start : sph_entity.particle_end, idx]
+                            positions=particles_all[sph_entity.particle_start : sph_entity.particle_end, env_i][
+                                active_all[sph_entity.particle_start : sph_entity.particle_end, env_i]
                             ],
                             radius=self.sim.sph_solver.particle_radius,
                             backend=sph_entity.surface.recon_backend,
@@ -758,11 +864,11 @@ class RasterizerContext:
                         mesh.visual = mu.surface_uvs_to_trimesh_visual(sph_entity.surface, n_verts=len(mesh.vertices))
                         self.add_dynamic_node(sph_entity, pyrender.Mesh.from_trimesh(mesh, smooth=True))
                     elif sph_entity.surface.vis_mode == "particle":
-                        tfs = np.tile(np.eye(4), (sph_entity.n_particles, 1, 1))
-                        tfs[:, :3, 3] = particles_all[sph_entity.particle_start : sph_entity.particle_end, idx]
+                        tfs_t = self._particles_tfs_t[(idx, sph_entity.uid)]
+                        tfs_t[:, 3, :3] = particles_all[sph_entity.particle_start : sph_entity.particle_end, env_i]
 
                         node = self.static_nodes[(idx, sph_entity.uid)]
-                        self.jit.update_buffer(node, "model", tfs.transpose((0, 2, 1)))
+                        self.jit.update_buffer(node, "model", tfs_t)
 
     def on_pbd(self):
         if self.sim.pbd_solver.is_active:
@@ -772,21 +878,25 @@ class RasterizerContext:
                     pbd_entity.vmesh.trimesh.visual = mu.surface_uvs_to_trimesh_visual(
                         pbd_entity.surface, uvs=pbd_entity.vmesh.uvs, n_verts=len(pbd_entity.vmesh.trimesh.vertices)
                     )
+                elif pbd_entity.surface.vis_mode == "particle" and self.render_particle_as == "sphere":
+                    # The sphere template is identical across environments, and pyrender copies it on upload
+                    sphere_mesh = mu.create_sphere(
+                        self.sim.pbd_solver.particle_radius * self.particle_size_scale, subdivisions=1
+                    )
+                    sphere_mesh.visual = mu.surface_uvs_to_trimesh_visual(
+                        pbd_entity.surface, n_verts=len(sphere_mesh.vertices)
+                    )
                 for idx in self.rendered_envs_idx:
                     if pbd_entity.surface.vis_mode == "recon":
                         self.add_dynamic_node(pbd_entity, None)
                     elif pbd_entity.surface.vis_mode == "particle":
                         if self.render_particle_as == "sphere":
-                            mesh = mu.create_sphere(
-                                self.sim.pbd_solver.particle_radius * self.particle_size_scale, subdivisions=1
+                            tfs = gu.trans_to_T(pbd_entity.init_particles)
+                            self._particles_tfs_t[(idx, pbd_entity.uid)] = np.ascontiguousarray(
+                                tfs.transpose((0, 2, 1)), dtype=np.float32
                             )
-                            mesh.visual = mu.surface_uvs_to_trimesh_visual(
-                                pbd_entity.surface, n_verts=len(mesh.vertices)
-                            )
-                            tfs = np.tile(np.eye(4), (pbd_entity.n_particles, 1, 1))
-                            tfs[:, :3, 3] = pbd_entity.init_particles
                             self.add_static_node(
-                                pbd_entity, pyrender.Mesh.from_trimesh(mesh, smooth=True, poses=tfs), i_b=idx
+                                pbd_entity, pyrender.Mesh.from_trimesh(sphere_mesh, smooth=True, poses=tfs), i_b=idx
                             )
                         elif self.render_particle_as == "tet":
                             mesh = mu.create_tets_mesh(
@@ -826,16 +936,26 @@ class RasterizerContext:
 
     def update_pbd(self):
         if self.sim.pbd_solver.is_active:
-            particles_all = qd_to_numpy(self.sim.pbd_solver.particles_render.pos) + self.scene.envs_offset
-            particles_vel_all = qd_to_numpy(self.sim.pbd_solver.particles_render.vel)
-            active_all = qd_to_numpy(self.sim.pbd_solver.particles_render.active).astype(dtype=np.bool_, copy=False)
-            vverts_all = qd_to_numpy(self.sim.pbd_solver.vverts_render.pos) + self.scene.envs_offset
+            # Only the rendered envs are gathered and offset
+            envs_offset = self.scene.envs_offset[self.rendered_envs_idx]
+            particles_all = (
+                qd_to_numpy(self.sim.pbd_solver.particles_render.pos, None, self.rendered_envs_idx) + envs_offset
+            )
+            particles_vel_all = qd_to_numpy(self.sim.pbd_solver.particles_render.vel, None, self.rendered_envs_idx)
+            active_all = qd_to_numpy(self.sim.pbd_solver.particles_render.active, None, self.rendered_envs_idx).astype(
+                dtype=np.bool_, copy=False
+            )
+            # Visual vertices are cast to the GL vertex format once for all entities, so that the per-entity reordering
+            # below is the only copy left.
+            vverts_all = (
+                qd_to_numpy(self.sim.pbd_solver.vverts_render.pos, None, self.rendered_envs_idx) + envs_offset
+            ).astype(np.float32, copy=False)
             for pbd_entity in self.sim.pbd_solver.entities:
-                for idx in self.rendered_envs_idx:
-                    particles_env = particles_all[:, idx]
-                    particles_vel_env = particles_vel_all[:, idx]
-                    active_env = active_all[:, idx]
-                    vverts_env = vverts_all[:, idx]
+                for env_i, idx in enumerate(self.rendered_envs_idx):
+                    particles_env = particles_all[:, env_i]
+                    particles_vel_env = particles_vel_all[:, env_i]
+                    active_env = active_all[:, env_i]
+                    vverts_env = vverts_all[:, env_i]
 
                     if pbd_entity.surface.vis_mode == "recon":
                         positions = particles_env[pbd_entity.particle_start : pbd_entity.particle_end][
@@ -852,11 +972,11 @@ class RasterizerContext:
                     # TODO: need to support multi-env visulaization for tet mode (it's using static node)
                     elif pbd_entity.surface.vis_mode == "particle":
                         if self.render_particle_as == "sphere":
-                            tfs = np.tile(np.eye(4), (pbd_entity.n_particles, 1, 1))
-                            tfs[:, :3, 3] = particles_env[pbd_entity.particle_start : pbd_entity.particle_end]
+                            tfs_t = self._particles_tfs_t[(idx, pbd_entity.uid)]
+                            tfs_t[:, 3, :3] = particles_env[pbd_entity.particle_start : pbd_entity.particle_end]
 
                             node = self.static_nodes[(idx, pbd_entity.uid)]
-                            self.jit.update_buffer(node, "model", tfs.transpose((0, 2, 1)))
+                            self.jit.update_buffer(node, "model", tfs_t)
 
                         elif self.render_particle_as == "tet":
                             new_verts = mu.transform_tets_mesh_verts(
@@ -865,7 +985,7 @@ class RasterizerContext:
                                 zs=particles_vel_env[pbd_entity.particle_start : pbd_entity.particle_end],
                             )
                             node = self.static_nodes[(idx, pbd_entity.uid)]
-                            update_data = self._scene.reorder_vertices(node, new_verts.astype(np.float32))
+                            update_data = self._reorder_vertices(node, new_verts.astype(np.float32, copy=False))
                             self.jit.update_buffer(node, "pos", update_data)
                             normal_data = self.jit.update_normal(node, update_data)
                             if normal_data is not None:
@@ -873,7 +993,7 @@ class RasterizerContext:
                     elif pbd_entity.surface.vis_mode == "visual":
                         vverts = vverts_env[pbd_entity.vvert_start : pbd_entity.vvert_end]
                         node = self.static_nodes[(idx, pbd_entity.uid)]
-                        update_data = self._scene.reorder_vertices(node, vverts.astype(np.float32))
+                        update_data = self._reorder_vertices(node, vverts)
                         self.jit.update_buffer(node, "pos", update_data)
                         normal_data = self.jit.update_normal(node, update_data)
                         if normal_data is not None:
@@ -907,8 +1027,15 @@ class RasterizerContext:
                         self.static_nodes[(i_b, vgeom.uid)] = static_node
                         self.create_node_seg(seg_key, static_node)
 
+                    # The topology is static, so both vertex gathers are folded into a single index array once
+                    vertex_mapping = node.primitives[0].vertex_mapping
+                    self._fem_render_verts_idx[vgeom.uid] = (
+                        vgeom.sim_verts_idx[vertex_mapping] if vertex_mapping is not None else vgeom.sim_verts_idx
+                    )
+
     def update_fem(self):
-        if self.sim.fem_solver.is_active:
+        # Refreshing the render state launches a kernel and copies all vertices back, wasted if no visual geom is drawn
+        if self.sim.fem_solver.is_active and self._fem_render_verts_idx:
             vertices_all = qd_to_numpy(
                 self.sim.fem_solver.get_state_render(self.sim.cur_substep_local),
                 self.rendered_envs_idx,
@@ -921,10 +1048,10 @@ class RasterizerContext:
 
                 sim_verts = vertices_all[:, fem_entity.v_start : fem_entity.v_start + fem_entity.n_vertices]
                 for vgeom in fem_entity.vgeoms:
+                    render_verts = sim_verts[:, self._fem_render_verts_idx[vgeom.uid]].astype(np.float32, copy=False)
                     for env_i, i_b in enumerate(self.rendered_envs_idx):
                         node = self.static_nodes[(i_b, vgeom.uid)]
-                        render_verts = sim_verts[env_i, vgeom.sim_verts_idx].astype(np.float32, copy=False)
-                        update_data = self._scene.reorder_vertices(node, render_verts)
+                        update_data = render_verts[env_i]
                         self.jit.update_buffer(node, "pos", update_data)
                         normal_data = self.jit.update_normal(node, update_data)
                         if normal_data is not None:
@@ -948,7 +1075,8 @@ class RasterizerContext:
     def draw_debug_arrow(
         self, pos, vec=(0.0, 0.0, 1.0), radius=0.006, color=(1.0, 0.0, 0.0, 0.5), persistent=True, env_idx=None
     ):
-        vec = tensor_to_array(vec, dtype=np.float32)
+        # The rotation is written in-place into a single pose, so a single direction is expected
+        vec = tensor_to_array(vec, dtype=np.float32).reshape((3,))
         length = np.linalg.norm(vec)
         if length > gs.EPS:
             mesh = mu.create_arrow(length=length, radius=radius, body_color=color, head_color=color)
@@ -957,12 +1085,15 @@ class RasterizerContext:
             pos = tensor_to_array(pos)
             if env_idx is not None and self.env_separate_rigid:
                 poses = np.zeros((len(self.rendered_envs_idx), 4, 4), dtype=np.float32)
-                gu.trans_R_to_T(pos, gu.z_up_to_R(vec), out=poses[env_idx])
+                pose = poses[env_idx]
                 env_shared = False
             else:
                 poses = np.zeros((1, 4, 4), dtype=np.float32)
-                gu.trans_R_to_T(pos, gu.z_up_to_R(vec), out=poses[0])
+                pose = poses[0]
                 env_shared = True
+            pose[3, 3] = 1.0
+            pose[:3, 3] = pos
+            gu.z_up_to_R(vec, out=pose[:3, :3])
 
             node = pyrender.Mesh.from_trimesh(
                 mesh, name=f"debug_arrow_{gs.UID()}", poses=poses, env_shared=env_shared, is_marker=True
@@ -973,12 +1104,32 @@ class RasterizerContext:
                 self.add_dynamic_node(None, node)
             return node
 
+    def draw_debug_arrows(self, poss, vecs, radius=0.006, color=(1.0, 0.0, 0.0, 0.5), persistent=True):
+        vecs = tensor_to_array(vecs, dtype=np.float32)
+        lengths = np.linalg.norm(vecs, axis=-1)
+        is_drawn = lengths > gs.EPS
+        if not is_drawn.any():
+            return None
+
+        # All arrows are instances of a single unit arrow, stretched along their own axes to their length and radius.
+        # Its body and head are proportional to both, so the result matches individually generated arrows.
+        mesh = mu.create_arrow(length=1.0, radius=1.0, body_color=color, head_color=color)
+        poses = np.zeros((np.count_nonzero(is_drawn), 4, 4), dtype=np.float32)
+        poses[:, 3, 3] = 1.0
+        poses[:, :3, 3] = tensor_to_array(poss)[is_drawn]
+        gu.z_up_to_R(vecs[is_drawn], out=poses[:, :3, :3])
+        radius = np.broadcast_to(radius, lengths.shape)[is_drawn]
+        poses[:, :3, :3] *= np.stack((radius, radius, lengths[is_drawn]), axis=-1)[:, np.newaxis]
+
+        node = pyrender.Mesh.from_trimesh(mesh, name=f"debug_arrows_{gs.UID()}", poses=poses, is_marker=True)
+        if persistent:
+            self.add_external_node(node)
+        else:
+            self.add_dynamic_node(None, node)
+        return node
+
     def draw_debug_frame(self, T, axis_length=1.0, origin_size=0.015, axis_radius=0.01, color=None):
-        mesh = trimesh.creation.axis(origin_size=origin_size, axis_radius=axis_radius, axis_length=axis_length)
-        if color is not None:
-            visual = trimesh.visual.ColorVisuals()
-            visual._data["vertex_colors"] = np.tile(mu.color_f32_to_u8(color), (len(mesh.vertices), 1))
-            mesh.visual = visual
+        mesh = mu.create_axis(origin_size=origin_size, axis_radius=axis_radius, axis_length=axis_length, color=color)
 
         n_envs = len(self.rendered_envs_idx)
         poses = tensor_to_array(T)
@@ -991,12 +1142,10 @@ class RasterizerContext:
         return node
 
     def draw_debug_frames(self, poses, axis_length=1.0, origin_size=0.015, axis_radius=0.01, color=None):
-        mesh = trimesh.creation.axis(origin_size=origin_size, axis_radius=axis_radius, axis_length=axis_length)
-        if color is not None:
-            visual = trimesh.visual.ColorVisuals()
-            visual._data["vertex_colors"] = np.tile(mu.color_f32_to_u8(color), (len(mesh.vertices), 1))
-            mesh.visual = visual
-        node = pyrender.Mesh.from_trimesh(mesh, name=f"debug_frame_{gs.UID()}", poses=poses, is_marker=True)
+        mesh = mu.create_axis(origin_size=origin_size, axis_radius=axis_radius, axis_length=axis_length, color=color)
+        node = pyrender.Mesh.from_trimesh(
+            mesh, name=f"debug_frame_{gs.UID()}", poses=tensor_to_array(poses), is_marker=True
+        )
         self.add_external_node(node)
         return node
 
@@ -1014,8 +1163,8 @@ class RasterizerContext:
         return node
 
     def draw_contact_arrow(self, pos, radius=0.005, force=(0, 0, 1), color=(0.0, 0.9, 0.8, 1.0), env_idx=None):
-        length = (tensor_to_array(force) * self.contact_force_scale,)
-        self.draw_debug_arrow(pos, length, radius, color=color, persistent=False, env_idx=env_idx)
+        vec = tensor_to_array(force) * self.contact_force_scale
+        return self.draw_debug_arrow(pos, vec, radius, color=color, persistent=False, env_idx=env_idx)
 
     def draw_debug_sphere(self, pos, radius=0.01, color=(1.0, 0.0, 0.0, 0.5), persistent=True):
         mesh = mu.create_sphere(radius=radius, color=color)
@@ -1110,7 +1259,8 @@ class RasterizerContext:
         poss = tensor_to_array(poss)
         colors = tensor_to_array(colors)
         if len(colors.shape) == 1:
-            colors = np.tile(colors, [len(poss), 1])
+            # The primitive makes its own contiguous single-precision copy, so a broadcast view avoids a second one
+            colors = np.broadcast_to(colors, (len(poss), len(colors)))
         elif len(colors.shape) == 2:
             assert colors.shape[0] == len(poss)
 
@@ -1141,35 +1291,37 @@ class RasterizerContext:
         self.clear_external_nodes()
 
     def update(self, force_render: bool = False):
-        # Early return if already updated previously
-        if not force_render and self._t >= self.scene._t:
-            return
-
-        # Update current time right away
-        self._t = self.scene._t
-
-        # Remove up old dynamic nodes
-        self.clear_dynamic_nodes(only_outdated=True)
-
-        # Force updating rendering-only quantities that are not updated automatically during simulation
-        self.visualizer.update_visual_states(force_render)
-
-        # Reset scene bounds to trigger recomputation. They are involved in shadow map.
-        self._scene._bounds = None
-
-        self.update_link_frame()
-        self.update_tool()
-        self.update_rigid()
-        self.update_contact()
-        self.update_mpm()
-        self.update_sph()
-        self.update_pbd()
-        self.update_fem()
-        self.update_sensors()
-
-        # Update camera fructum
-        for camera in self.visualizer.cameras:
-            self.update_camera_frustum(camera)
+        # Buffer updates must not interleave with their upload by the viewer thread, which holds the same lock
+        with self.visualizer.viewer_lock:
+            # Early return if already updated previously
+            if not force_render and self._t >= self.scene._t:
+                return
+
+            # Update current time right away
+            self._t = self.scene._t
+
+            # Remove up old dynamic nodes
+            self.clear_dynamic_nodes(only_outdated=True)
+
+            # Force updating rendering-only quantities that are not updated automatically during simulation
+            self.visualizer.update_visual_states(force_render)
+
+            # Reset scene bounds to trigger recomputation. They are involved in shadow map.
+            self._scene._bounds = None
+
+            self.update_link_frame()
+            self.update_tool()
+            self.update_rigid()
+            self.update_contact()
+            self.update_mpm()
+            self.update_sph()
+            self.update_pbd()
+            self.update_fem()
+            self.update_sensors()
+
+            # Update camera fructum
+            for camera in self.visualizer.cameras:
+                self.update_camera_frustum(camera)
 
     def add_light(self, light):
         # light direction is light pose's -z frame
@@ -1192,20 +1344,26 @@ class RasterizerContext:
         self.seg_node_map.pop(seg_node, None)
 
     def seg_idxc_to_idxc_rgb(self, seg_idxc):
-        seg_idxc_rgb = np.array(
-            [
-                (seg_idxc >> 16) & 0xFF,
-                (seg_idxc >> 8) & 0xFF,
-                seg_idxc & 0xFF,
-            ],
-            dtype=np.int32,
-        )
+        seg_idxc_rgb = self._seg_idxc_to_idxc_rgb.get(seg_idxc)
+        if seg_idxc_rgb is None:
+            seg_idxc_rgb = np.array(
+                [
+                    (seg_idxc >> 16) & 0xFF,
+                    (seg_idxc >> 8) & 0xFF,
+                    seg_idxc & 0xFF,
+                ],
+                dtype=np.int32,
+            )
+            seg_idxc_rgb.flags.writeable = False
+            self._seg_idxc_to_idxc_rgb[seg_idxc] = seg_idxc_rgb
         return seg_idxc_rgb
 
     def seg_idxc_rgb_arr_to_idxc_arr(self, seg_idxc_rgb_arr):
-        # Combine the RGB components into a single integer
-        seg_idxc_rgb_arr = seg_idxc_rgb_arr.astype(np.int64, copy=False)
-        return seg_idxc_rgb_arr[..., 0] * (256 * 256) + seg_idxc_rgb_arr[..., 1] * 256 + seg_idxc_rgb_arr[..., 2]
+        # Combine the RGB components into a single integer. This runs on every segmentation frame, so the channels are
+        # packed in a single pass over the image.
+        seg_idxc_arr = np.empty(seg_idxc_rgb_arr.shape[:-1], dtype=np.int32)
+        _seg_idxc_rgb_to_idxc(seg_idxc_rgb_arr.reshape((-1, 3)), seg_idxc_arr.reshape((-1,)))
+        return seg_idxc_arr
 
     def colorize_seg_idxc_arr(self, seg_idxc_arr):
         return self.seg_color_map.colorize_seg_idxc_arr(seg_idxc_arr)
@@ -940,6 +940,12 @@ def test_fps_tracker():
     # num envs * [num steps] / (delta time)
     assert math.isclose(fps, n_envs * 4 / 0.14)
 
+    tracker.reset(n_envs=2 * n_envs)
+    assert not tracker.step(current_time=11.0)
+    assert not tracker.step(current_time=11.05)
+    fps = tracker.step(current_time=11.25)
+    assert math.isclose(fps, 2 * n_envs * 2 / 0.25)
+
 
 @pytest.mark.required
 def test_warn_once_logs_once(clear_seen_fixture):
@@ -45,17 +45,19 @@ def test_draw_debug(renderer, show_viewer):
         vec=(0, 0.3, 0.8),
         color=(1, 0, 0),
     )
-    scene.draw_debug_line(
-        start=(0.7, -0.3, 0.7),
-        end=(0.6, 0.2, 0.7),
-        radius=0.01,
-        color=(1, 0, 0, 1),
-    )
-    sphere_obj = scene.draw_debug_sphere(
-        pos=(-0.3, 0.3, 0.0),
-        radius=0.15,
-        color=(0, 1, 0),
-    )
+    with scene.debug_batch():
+        scene.draw_debug_line(
+            start=(0.7, -0.3, 0.7),
+            end=(0.6, 0.2, 0.7),
+            radius=0.01,
+            color=(1, 0, 0, 1),
+        )
+        with scene.debug_batch():
+            sphere_obj = scene.draw_debug_sphere(
+                pos=(-0.3, 0.3, 0.0),
+                radius=0.15,
+                color=(0, 1, 0),
+            )
     frame_obj = scene.draw_debug_frame(
         T=np.array(
             [
@@ -92,6 +94,111 @@ def test_draw_debug(renderer, show_viewer):
     assert_allclose(np.std(rgb_array.reshape((-1, 3)), axis=0), 0.0, tol=gs.EPS)
 
 
+@pytest.mark.required
+@pytest.mark.parametrize("renderer_type", [RENDERER_TYPE.RASTERIZER])
+def test_draw_debug_arrows(renderer, show_viewer):
+    if "GS_DISABLE_OFFSCREEN_MARKERS" in os.environ:
+        pytest.skip("Offscreen rendering of markers is forcibly disabled. Skipping...")
+
+    scene = gs.Scene(
+        renderer=renderer,
+        show_viewer=show_viewer,
+        show_FPS=False,
+    )
+    cam = scene.add_camera(
+        pos=(2.0, 1.0, 1.5),
+        lookat=(0.0, 0.0, 0.2),
+        up=(0.0, 0.0, 1.0),
+        res=(320, 320),
+        debug=True,
+        GUI=show_viewer,
+    )
+    scene.build()
+    context = scene.visualizer.context
+
+    poss = np.array([[0.0, 0.0, 0.0], [0.2, -0.3, 0.1], [0.5, 0.5, 0.5], [-0.3, 0.2, 0.0]])
+    vecs = np.array([[0.0, 0.0, 0.5], [0.4, 0.0, 0.0], [0.0, 0.0, 0.0], [0.2, 0.2, 0.3]])
+    radii = np.array([0.02, 0.03, 0.04, 0.05])
+    color = (0.0, 0.9, 0.8, 1.0)
+
+    # Reference rendering based on individually generated arrows
+    for pos, vec, radius in zip(poss, vecs, radii):
+        context.draw_debug_arrow(pos, vec, radius, color=color)
+    scene.visualizer.update()
+    rgb_ref, *_ = cam.render(rgb=True, depth=False, segmentation=False, colorize_seg=False, normal=False)
+    assert (np.std(rgb_ref.reshape((-1, 3)).astype(np.int32), axis=0) > 10.0).any()
+    scene.clear_debug_objects()
+
+    # Zero-length arrows must be skipped rather than instantiated as degenerate instances
+    node = context.draw_debug_arrows(poss, vecs, radii, color=color)
+    (primitive,) = node.primitives
+    assert primitive.poses.shape == (3, 4, 4)
+    scene.visualizer.update()
+    rgb_array, *_ = cam.render(rgb=True, depth=False, segmentation=False, colorize_seg=False, normal=False)
+    assert np.abs(rgb_array.astype(np.float32) - rgb_ref.astype(np.float32)).mean() < 1.0
+    scene.clear_debug_objects()
+
+    # The radius is broadcast to all arrows, and applied anisotropically with respect to their length
+    node = context.draw_debug_arrows(poss[:2], vecs[:2], 0.01, color=color)
+    (primitive,) = node.primitives
+    assert_allclose(primitive.poses[0, :3, :3], np.diag((0.01, 0.01, 0.5)), tol=1e-6)
+    assert_allclose(primitive.poses[1, :3, 3], poss[1], tol=1e-6)
+    assert_allclose(np.linalg.norm(primitive.poses[1, :3, :3], axis=0), (0.01, 0.01, 0.4), tol=1e-6)
+    assert context.draw_debug_arrows(poss[2:3], vecs[2:3]) is None
+
+
+@pytest.mark.required
+@pytest.mark.parametrize("env_separate_rigid", [False, True])
+@pytest.mark.parametrize("renderer_type", [RENDERER_TYPE.RASTERIZER])
+def test_draw_contact_arrows(env_separate_rigid, renderer, show_viewer):
+    if "GS_DISABLE_OFFSCREEN_MARKERS" in os.environ:
+        pytest.skip("Offscreen rendering of markers is forcibly disabled. Skipping...")
+
+    scene = gs.Scene(
+        vis_options=gs.options.VisOptions(
+            show_world_frame=False,
+            show_link_frame=False,
+            shadow=False,
+            env_separate_rigid=env_separate_rigid,
+        ),
+        renderer=renderer,
+        show_viewer=show_viewer,
+        show_FPS=False,
+    )
+    scene.add_entity(gs.morphs.Plane())
+    scene.add_entity(
+        gs.morphs.Box(
+            size=(0.2, 0.2, 0.2),
+            # Add small negative offset to force contact with the ground
+            pos=(0.0, 0.0, 0.09),
+        ),
+        visualize_contact=True,
+    )
+    cam = scene.add_camera(
+        pos=(1.0, 1.0, 0.6),
+        lookat=(0.0, 0.0, 0.05),
+        fov=40,
+        res=(320, 320),
+        GUI=show_viewer,
+    )
+    cam_debug = scene.add_camera(
+        pos=(1.0, 1.0, 0.6),
+        lookat=(0.0, 0.0, 0.05),
+        fov=40,
+        res=(320, 320),
+        debug=True,
+        GUI=show_viewer,
+    )
+    scene.build(n_envs=2)
+    scene.step()
+
+    # Contact arrows are markers, so they only show up on debug cameras, for every rendered environment
+    rgb_array, *_ = cam.render(rgb=True, depth=False, segmentation=False, colorize_seg=False, normal=False)
+    rgb_debug, *_ = cam_debug.render(rgb=True, depth=False, segmentation=False, colorize_seg=False, normal=False)
+    n_diff_pixels = np.sum(np.abs(rgb_array.astype(np.int32) - rgb_debug).max(axis=-1) > 0, axis=(-2, -1))
+    assert (n_diff_pixels > 50).all()
+
+
 @pytest.mark.slow  # ~250s
 @pytest.mark.required
 @pytest.mark.parametrize("n_envs", [0, 2])
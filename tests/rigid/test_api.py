@@ -929,6 +929,51 @@ def test_reset(show_viewer):
         assert_allclose(actual[BOOL_MASK], fallen_ref[BOOL_MASK], tol=gs.EPS)
 
 
+@pytest.mark.required
+@pytest.mark.parametrize("n_envs", [0, 2])
+def test_get_state_out(n_envs, show_viewer):
+    scene = gs.Scene(
+        show_viewer=show_viewer,
+    )
+    scene.add_entity(
+        gs.morphs.Box(
+            size=(0.1, 0.1, 0.1),
+            pos=(0, 0, 0.5),
+        )
+    )
+    scene.build(n_envs=n_envs)
+
+    init_state = scene.get_state()
+    init_rigid_state = next(s for s in init_state.solvers_state if isinstance(s, RigidSolverState))
+    scene.step()
+    state = scene.get_state()
+    rigid_state = next(s for s in state.solvers_state if isinstance(s, RigidSolverState))
+
+    for _ in range(10):
+        scene.step()
+    scene.get_state(out=state)
+    ref_state = scene.get_state()
+    ref_rigid_state = next(s for s in ref_state.solvers_state if isinstance(s, RigidSolverState))
+    assert state.s_global == ref_state.s_global
+    for actual, ref in (
+        (rigid_state.qpos, ref_rigid_state.qpos),
+        (rigid_state.dofs_vel, ref_rigid_state.dofs_vel),
+        (rigid_state.links_pos, ref_rigid_state.links_pos),
+        (rigid_state.links_quat, ref_rigid_state.links_quat),
+    ):
+        assert_allclose(actual, ref, tol=gs.EPS)
+
+    scene.reset(state=init_state)
+    scene.get_state(out=state)
+    for actual, ref in (
+        (rigid_state.qpos, init_rigid_state.qpos),
+        (rigid_state.dofs_vel, init_rigid_state.dofs_vel),
+        (rigid_state.links_pos, init_rigid_state.links_pos),
+        (rigid_state.links_quat, init_rigid_state.links_quat),
+    ):
+        assert_allclose(actual, ref, tol=gs.EPS)
+
+
 @pytest.mark.slow  # ~350s
 @pytest.mark.required
 @pytest.mark.parametrize("backend", [gs.cpu, gs.gpu])
@@ -957,20 +1002,24 @@ def test_scene_saver_franka(tmp_path, show_viewer, tol):
 
     pose_ref = franka1.get_dofs_position(dof_idx)
 
-    ckpt_path = tmp_path / "franka_unit.pkl"
-    scene1.save_checkpoint(ckpt_path)
+    ckpt_paths = (tmp_path / "franka_unit.npz", tmp_path / "franka_unit_compressed.npz")
+    scene1.save_checkpoint(ckpt_paths[0])
+    scene1.save_checkpoint(ckpt_paths[1], compress=True)
+    assert ckpt_paths[1].stat().st_size < ckpt_paths[0].stat().st_size
 
     scene2 = gs.Scene(show_viewer=show_viewer)
     franka2 = scene2.add_entity(
         gs.morphs.MJCF(file="xml/franka_emika_panda/panda.xml"),
     )
     scene2.build()
-    scene2.load_checkpoint(ckpt_path)
+    for ckpt_path in ckpt_paths:
+        scene2.reset()
+        scene2.load_checkpoint(ckpt_path)
 
-    pose_loaded = franka2.get_dofs_position(dof_idx)
+        pose_loaded = franka2.get_dofs_position(dof_idx)
 
-    # FIXME: It should be possible to achieve better accuracy with 64bits precision
-    assert_allclose(pose_ref, pose_loaded, tol=2e-6)
+        # FIXME: It should be possible to achieve better accuracy with 64bits precision
+        assert_allclose(pose_ref, pose_loaded, tol=2e-6)
 
 
 @pytest.mark.required